@@ -5,6 +5,7 @@ User-friendly interface for merging documents into NotebookLM-compatible batches
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import multiprocessing
 import threading
 from collections import deque
 import os
@@ -577,4 +578,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the PDF merge worker processes in PyInstaller builds.
+    multiprocessing.freeze_support()
     main()
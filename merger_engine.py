@@ -4,8 +4,11 @@ Handles PDF, DOCX, and Email merging with flexible folder structure support
 """
 
 import atexit
+import io
+import multiprocessing
 import os
 import json
+import queue
 from copy import deepcopy
 from datetime import datetime, timezone
 import shutil
@@ -14,10 +17,39 @@ import threading
 import uuid
 import zipfile
 import traceback
-from typing import List, Dict, Optional, Tuple, Set, Any, Callable
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import IO, List, Dict, Optional, Tuple, Set, Any, Callable, Iterator, Union
 from collections import defaultdict
+from operator import itemgetter
 import re
 
+# Buffer size for merged output writes; large enough that a typical batch is
+# flushed in a handful of write() calls instead of many 8 KB ones.
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Processable input extensions mapped to the merger that handles them.
+_EXT_MAP = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'docx',
+    '.msg': 'email',
+    '.eml': 'email',
+}
+
+# Separator rules used by the plain-text email outputs.
+_SECTION_RULE = "=" * 80
+_ENTRY_RULE = "-" * 80
+
+# WordprocessingML tags used by the raw-XML DOCX fallbacks.
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_P = f'{{{_W_NS}}}p'
+_W_T = f'{{{_W_NS}}}t'
+
+# Email subject normalization: strip any stack of reply/forward prefixes
+# ("RE: FW: RE: ...") and collapse whitespace.
+_SUBJECT_PREFIX_RE = re.compile(r'^(?:(?:RE|FW|FWD)\s*:\s*)+', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
 # Module-level tracking of temp dirs for atexit cleanup if process is killed.
 _active_temp_dirs: Set[str] = set()
 _active_temp_dirs_lock = threading.Lock()
@@ -40,10 +72,30 @@ try:
 except ImportError:
     HAS_PYPDF = False
 
+# Native (qpdf) PDF merge backend (optional)
+try:
+    import pikepdf
+    HAS_PIKEPDF = True
+except ImportError:
+    HAS_PIKEPDF = False
+
+# Fast JSON serialization for the merge manifest (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Vectorized byte scanning for legacy .doc text recovery (optional)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # Image handling (for converting images masquerading as PDFs)
 try:
     from PIL import Image
-    import io
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
@@ -53,6 +105,8 @@ try:
     from docx import Document
     from docx.shared import Pt, Inches
     from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.oxml import parse_xml
+    from lxml import etree
     HAS_DOCX = True
 except ImportError:
     HAS_DOCX = False
@@ -74,6 +128,7 @@ except ImportError:
 
 from email import policy
 from email.parser import BytesParser
+from email.utils import parsedate_to_datetime
 
 try:
     from dateutil import parser as date_parser
@@ -92,6 +147,179 @@ def _record_warning(warnings: Optional[List[Dict]], code: str, message: str, **c
     warnings.append(warning)
 
 
+def _write_json_file(path: str, payload: Dict) -> None:
+    """Write a JSON document with 2-space indentation, using orjson when available."""
+    if HAS_ORJSON:
+        with open(path, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    # iterencode yields many small chunks; hand them to one large buffer.
+    with open(path, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+        f.writelines(json.JSONEncoder(indent=2).iterencode(payload))
+
+
+def _split_file_entry(entry: Union[str, Tuple[str, int]]) -> Tuple[str, Optional[int]]:
+    """Return (path, size) for a plain path or a pre-stat'ed (path, size) tuple."""
+    if isinstance(entry, tuple):
+        return entry[0], entry[1]
+    return entry, None
+
+
+def _file_kind(file_path: str) -> Optional[str]:
+    """Return the _EXT_MAP kind ('pdf', 'docx' or 'email') for a path, or None if unsupported."""
+    return _EXT_MAP.get(os.path.splitext(file_path)[1].lower())
+
+
+def _prefetch_iter(paths: List[str], depth: int = 2) -> Iterator[Tuple[str, Optional[io.BytesIO]]]:
+    """
+    Yield (path, BytesIO of its contents) while a background thread reads up
+    to `depth` files ahead, overlapping disk reads with parsing. The buffer is
+    None when the read failed, so callers fall back to opening the path.
+    """
+    if len(paths) < 2:
+        for path in paths:
+            yield path, None
+        return
+
+    results: "queue.Queue[Tuple[str, Optional[io.BytesIO]]]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _reader() -> None:
+        for path in paths:
+            try:
+                with open(path, 'rb', buffering=_OUTPUT_BUFFER_SIZE) as handle:
+                    item = (path, io.BytesIO(handle.read()))
+            except Exception:
+                item = (path, None)
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if stop.is_set():
+                return
+
+    worker = threading.Thread(target=_reader, name="pdf-prefetch", daemon=True)
+    worker.start()
+    try:
+        for _ in paths:
+            yield results.get()
+    finally:
+        # Unblock the reader if the consumer stopped early.
+        stop.set()
+        worker.join()
+
+
+def _with_file_sizes(
+    paths: List[str],
+    known_sizes: Optional[Dict[str, int]] = None,
+) -> List[Union[str, Tuple[str, int]]]:
+    """
+    Pair each path with its size, stat'ing only paths missing from known_sizes,
+    so batch estimation and merging share one size lookup per file. Paths that
+    cannot be stat'ed stay bare and the merger reports them.
+    """
+    entries: List[Union[str, Tuple[str, int]]] = []
+    for path in paths:
+        size = known_sizes.get(path) if known_sizes else None
+        if size is None:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                entries.append(path)
+                continue
+        entries.append((path, size))
+    return entries
+
+
+def _release_pdf_reader(reader) -> None:
+    """Close a PdfReader and clear its object cache; ignores readers without close()."""
+    if reader is None:
+        return
+    try:
+        reader.close()
+    except Exception:
+        pass
+
+
+# Leading signatures used to route files with a .pdf extension that pypdf
+# cannot read to the one fallback converter that can handle them.
+_MAGIC_SIGNATURES = (
+    (b'%PDF', 'pdf'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'ole'),
+    (b'\xff\xd8\xff', 'image'),
+    (b'\x89PNG\r\n\x1a\n', 'image'),
+    (b'GIF8', 'image'),
+    (b'II*\x00', 'image'),
+    (b'MM\x00*', 'image'),
+    (b'BM', 'image'),
+)
+
+
+def _sniff_file_type(file_path: str) -> str:
+    """Classify a file by its leading bytes as 'pdf', 'ole', 'image' or 'unknown'."""
+    try:
+        with open(file_path, 'rb') as handle:
+            head = handle.read(8)
+    except OSError:
+        return 'unknown'
+    for signature, kind in _MAGIC_SIGNATURES:
+        if head.startswith(signature):
+            return kind
+    return 'unknown'
+
+
+# bytes.translate table keeping printable ASCII plus tab/LF/CR; every other
+# byte becomes NUL so runs can be separated with a single split.
+_PRINTABLE_BYTE_TABLE = bytes(
+    byte if 32 <= byte < 127 or byte in (9, 10, 13) else 0
+    for byte in range(256)
+)
+
+
+def _extract_printable_runs(raw: bytes, min_run: int = 4) -> str:
+    """
+    Return runs of printable ASCII (plus tab/CR/LF) of at least min_run bytes,
+    joined with newlines. Used to salvage text from binary OLE streams.
+    """
+    if HAS_NUMPY:
+        arr = np.frombuffer(raw, dtype=np.uint8)
+        mask = ((arr >= 32) & (arr < 127)) | (arr == 9) | (arr == 10) | (arr == 13)
+        edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = (ends - starts) >= min_run
+        return '\n'.join(
+            raw[start:end].decode('ascii')
+            for start, end in zip(starts[keep].tolist(), ends[keep].tolist())
+        )
+
+    # Map every non-printable byte to NUL in one C-level pass, then split on it.
+    return '\n'.join(
+        run.decode('ascii')
+        for run in raw.translate(_PRINTABLE_BYTE_TABLE).split(b'\x00')
+        if len(run) >= min_run
+    )
+
+
+def _docx_document_entry(archive: zipfile.ZipFile) -> Optional[str]:
+    """
+    Return the main document part of a DOCX archive. Nearly every file uses
+    the canonical word/document.xml, so look that up directly and only scan
+    the member list (some files store it at another path) when it is missing.
+    """
+    try:
+        archive.getinfo('word/document.xml')
+        return 'word/document.xml'
+    except KeyError:
+        pass
+    for name in archive.namelist():
+        if name.endswith('document.xml'):
+            return name
+    return None
+
+
 def _safe_progress(callback, *args) -> None:
     """Call a progress callback, swallowing exceptions to avoid crashing the merge."""
     if callback is None:
@@ -424,14 +652,20 @@ class XlsxToCsvConverter:
 
 class PDFMerger:
     """Merges multiple PDF files into batched output files"""
+
+    BACKENDS = ("pypdf", "pikepdf")
     
-    def __init__(self, max_file_size_kb=102400):
+    def __init__(self, max_file_size_kb=102400, backend="pypdf"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend!r} (expected one of {', '.join(self.BACKENDS)})")
         self.max_file_size_kb = max_file_size_kb
         self.max_file_size_bytes = max_file_size_kb * 1024
+        # pikepdf copies page objects natively in qpdf; without it, stay on pypdf.
+        self.backend = backend if backend != "pikepdf" or HAS_PIKEPDF else "pypdf"
         
-    def estimate_batch_count(self, pdf_files: List[str]) -> int:
+    def estimate_batch_count(self, pdf_files: List[Union[str, Tuple[str, int]]]) -> int:
         """Estimate how many output batches a merge operation will create."""
-        pdf_files = sorted(pdf_files)
+        pdf_files = sorted(pdf_files, key=lambda entry: _split_file_entry(entry)[0])
         if not pdf_files:
             return 0
 
@@ -441,11 +675,13 @@ class PDFMerger:
         current_batch_size = 0
         current_batch_words = 0
 
-        for pdf_file in pdf_files:
-            try:
-                file_size = os.path.getsize(pdf_file)
-            except OSError:
-                file_size = self.max_file_size_bytes
+        for entry in pdf_files:
+            pdf_file, file_size = _split_file_entry(entry)
+            if file_size is None:
+                try:
+                    file_size = os.path.getsize(pdf_file)
+                except OSError:
+                    file_size = self.max_file_size_bytes
 
             file_words = self._estimate_pdf_word_count(pdf_file)
 
@@ -484,7 +720,7 @@ class PDFMerger:
 
     def merge_pdfs(
         self,
-        pdf_files: List[str],
+        pdf_files: List[Union[str, Tuple[str, int]]],
         output_path: str,
         group_name: str,
         warnings: Optional[List[Dict]] = None,
@@ -492,14 +728,21 @@ class PDFMerger:
         bookmark_titles: Optional[Dict[str, str]] = None,
         source_file_map: Optional[Dict[str, str]] = None,
         output_to_sources: Optional[Dict[str, List[str]]] = None,
+        output_page_counts: Optional[Dict[str, int]] = None,
+        executor: Optional[Executor] = None,
     ) -> List[str]:
         """
         Merge PDF files into batches, staying under size limit
         
         Args:
-            pdf_files: List of PDF file paths to merge
+            pdf_files: List of PDF file paths (or (path, size) tuples) to merge
             output_path: Directory to save merged PDFs
             group_name: Name prefix for output files (e.g., "case_12345")
+            output_page_counts: Optional dict filled with the page count of
+                each output file, so callers need not re-open what was written
+            executor: Optional process pool; batches are independent, so each
+                one is saved in a worker while planning continues. A batch
+                whose worker fails is saved in-process instead.
             
         Returns:
             List of created output file paths
@@ -508,10 +751,12 @@ class PDFMerger:
             raise ImportError("pypdf library is required for PDF merging")
         
         os.makedirs(output_path, exist_ok=True)
-        output_files = []
+        # Each slot is an output path or a pending (batch, batch_num, future),
+        # kept in batch order.
+        output_slots: List[Union[str, Tuple[List[str], int, Future]]] = []
 
         # Sort PDFs by name for consistent ordering
-        pdf_files = sorted(pdf_files)
+        pdf_files = sorted(pdf_files, key=lambda entry: _split_file_entry(entry)[0])
 
         current_batch = []
         current_batch_size = 0
@@ -521,39 +766,69 @@ class PDFMerger:
         batch_num = 1
 
         def _flush_batch():
-            nonlocal batch_num, current_batch, current_batch_size, current_batch_words
+            nonlocal batch_num, current_batch, current_batch_size, current_batch_words, executor
             if not current_batch:
                 return
-            output_file = self._save_pdf_batch(
-                current_batch,
-                output_path,
-                group_name,
-                batch_num,
-                warnings,
-                output_label=output_label,
-                bookmark_titles=bookmark_titles,
-                source_file_map=source_file_map,
-                output_to_sources=output_to_sources,
-            )
-            if output_file:
-                output_files.append(output_file)
+            if executor is not None:
+                try:
+                    future = executor.submit(
+                        _save_pdf_batch_worker,
+                        self,
+                        current_batch,
+                        output_path,
+                        group_name,
+                        batch_num,
+                        output_label,
+                        bookmark_titles,
+                        source_file_map,
+                    )
+                except BrokenExecutor as exc:
+                    # A worker crashed earlier in this merge; save the rest in-process.
+                    _record_warning(
+                        warnings,
+                        'pdf_batch_worker_failed',
+                        'PDF worker pool is unavailable; saving remaining batches in-process',
+                        group=group_name,
+                        batch=batch_num,
+                        error=str(exc),
+                    )
+                    executor = None
+                else:
+                    output_slots.append((current_batch, batch_num, future))
+            if executor is None:
+                output_file = self._save_pdf_batch(
+                    current_batch,
+                    output_path,
+                    group_name,
+                    batch_num,
+                    warnings,
+                    output_label=output_label,
+                    bookmark_titles=bookmark_titles,
+                    source_file_map=source_file_map,
+                    output_to_sources=output_to_sources,
+                    output_page_counts=output_page_counts,
+                )
+                if output_file:
+                    output_slots.append(output_file)
             batch_num += 1
             current_batch = []
             current_batch_size = 0
             current_batch_words = 0
 
-        for pdf_file in pdf_files:
-            try:
-                file_size = os.path.getsize(pdf_file)
-            except OSError as exc:
-                _record_warning(
-                    warnings,
-                    'pdf_stat_failed',
-                    'Could not determine PDF file size; using max batch size for pre-allocation',
-                    file=pdf_file,
-                    error=str(exc),
-                )
-                file_size = self.max_file_size_bytes
+        for entry in pdf_files:
+            pdf_file, file_size = _split_file_entry(entry)
+            if file_size is None:
+                try:
+                    file_size = os.path.getsize(pdf_file)
+                except OSError as exc:
+                    _record_warning(
+                        warnings,
+                        'pdf_stat_failed',
+                        'Could not determine PDF file size; using max batch size for pre-allocation',
+                        file=pdf_file,
+                        error=str(exc),
+                    )
+                    file_size = self.max_file_size_bytes
 
             # Estimate word count from page count (fast, no text extraction)
             file_words = self._estimate_pdf_word_count(pdf_file)
@@ -573,8 +848,9 @@ class PDFMerger:
                     bookmark_titles=bookmark_titles,
                     source_file_map=source_file_map,
                     output_to_sources=output_to_sources,
+                    output_page_counts=output_page_counts,
                 )
-                output_files.extend(split_files)
+                output_slots.extend(split_files)
                 batch_num += len(split_files)
                 continue
 
@@ -589,9 +865,70 @@ class PDFMerger:
 
         # Save remaining files
         _flush_batch()
+
+        output_files = []
+        for slot in output_slots:
+            if isinstance(slot, str):
+                output_files.append(slot)
+                continue
+            batch, slot_batch_num, future = slot
+            try:
+                output_file, batch_warnings, batch_sources, batch_pages = future.result()
+            except Exception as exc:
+                # A crashed worker or a broken pool must not drop the batch:
+                # save it here instead.
+                _record_warning(
+                    warnings,
+                    'pdf_batch_worker_failed',
+                    'PDF batch worker failed; saving batch in-process instead',
+                    group=group_name,
+                    batch=slot_batch_num,
+                    error=str(exc),
+                )
+                output_file = self._save_pdf_batch(
+                    batch,
+                    output_path,
+                    group_name,
+                    slot_batch_num,
+                    warnings,
+                    output_label=output_label,
+                    bookmark_titles=bookmark_titles,
+                    source_file_map=source_file_map,
+                    output_to_sources=output_to_sources,
+                    output_page_counts=output_page_counts,
+                )
+                if output_file:
+                    output_files.append(output_file)
+                continue
+            if warnings is not None:
+                warnings.extend(batch_warnings)
+            if output_to_sources is not None:
+                output_to_sources.update(batch_sources)
+            if output_page_counts is not None:
+                output_page_counts.update(batch_pages)
+            if output_file:
+                output_files.append(output_file)
         
         return output_files
     
+    def _convert_non_pdf_to_pdf(self, file_path: str) -> Optional[bytes]:
+        """
+        Fallback for files the PDF reader rejected: sniff the leading bytes and
+        try only the matching converter (image or OLE .doc). A file that really
+        starts with %PDF is just damaged, so no conversion is attempted.
+        """
+        kind = _sniff_file_type(file_path)
+        if kind == 'pdf':
+            return None
+        pdf_bytes = None
+        if kind in ('image', 'unknown'):
+            # Fallback 1: File may be an image with a .pdf extension
+            pdf_bytes = self._try_convert_image_to_pdf(file_path)
+        if not pdf_bytes and kind in ('ole', 'unknown'):
+            # Fallback 2: File may be an OLE .doc with a .pdf extension
+            pdf_bytes = self._try_convert_ole_doc_to_pdf(file_path)
+        return pdf_bytes
+
     def _try_convert_image_to_pdf(self, file_path: str) -> Optional[bytes]:
         """
         Attempt to open a file as an image and convert it to PDF bytes.
@@ -632,19 +969,8 @@ class PDFMerger:
                 # The actual text in .doc files is in a complex binary format,
                 # but we can try extracting readable ASCII/Unicode content
                 raw = ole.openstream('WordDocument').read()
-                # Extract printable text chunks
-                text_chunks = []
-                current_chunk = []
-                for byte in raw:
-                    if 32 <= byte < 127 or byte in (10, 13, 9):
-                        current_chunk.append(chr(byte))
-                    else:
-                        if len(current_chunk) > 3:  # Only keep chunks > 3 chars
-                            text_chunks.append(''.join(current_chunk))
-                        current_chunk = []
-                if len(current_chunk) > 3:
-                    text_chunks.append(''.join(current_chunk))
-                text = '\n'.join(text_chunks)
+                # Extract printable text chunks (only keep chunks > 3 chars)
+                text = _extract_printable_runs(raw)
             ole.close()
 
             if not text.strip():
@@ -697,6 +1023,7 @@ class PDFMerger:
 
     def _estimate_pdf_word_count(self, pdf_file: str) -> int:
         """Estimate word count from page count (~250 words/page). Instant, no text extraction."""
+        reader = None
         try:
             reader = PdfReader(pdf_file)
             if reader.is_encrypted:
@@ -706,6 +1033,8 @@ class PDFMerger:
             return len(reader.pages) * 250
         except Exception:
             return 0
+        finally:
+            _release_pdf_reader(reader)
 
     def _split_oversized_pdf(
         self,
@@ -719,6 +1048,7 @@ class PDFMerger:
         bookmark_titles: Optional[Dict[str, str]] = None,
         source_file_map: Optional[Dict[str, str]] = None,
         output_to_sources: Optional[Dict[str, List[str]]] = None,
+        output_page_counts: Optional[Dict[str, int]] = None,
     ) -> List[str]:
         """Split a single oversized PDF into multiple batch files by page ranges."""
         output_files: List[str] = []
@@ -790,7 +1120,7 @@ class PDFMerger:
                 output_filename = f"{group_name}_{output_label}_batch{batch_num}.pdf"
                 output_file = os.path.join(output_path, output_filename)
 
-                with open(output_file, 'wb') as f:
+                with open(output_file, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as f:
                     f.write(buf.getvalue())
 
                 # Track source mapping
@@ -798,6 +1128,8 @@ class PDFMerger:
                     original = (source_file_map.get(pdf_file, pdf_file)
                                 if source_file_map else pdf_file)
                     output_to_sources[output_file] = [original]
+                if output_page_counts is not None:
+                    output_page_counts[output_file] = chunk_size
 
                 out_size_mb = chunk_bytes / (1024 * 1024)
                 end_page = page_cursor + chunk_size
@@ -819,6 +1151,48 @@ class PDFMerger:
 
         return output_files
 
+    def _copy_single_pdf_batch(
+        self,
+        pdf_file: str,
+        output_path: str,
+        group_name: str,
+        batch_num: int,
+        output_label: str = "pdfs",
+        source_file_map: Optional[Dict[str, str]] = None,
+        output_to_sources: Optional[Dict[str, List[str]]] = None,
+        output_page_counts: Optional[Dict[str, int]] = None,
+    ) -> Optional[str]:
+        """
+        Write a one-file batch by copying the source PDF byte-for-byte.
+        Returns None when the file needs the full merge path instead
+        (unreadable, encrypted, or without pages).
+        """
+        reader = None
+        try:
+            reader = PdfReader(pdf_file)
+            if reader.is_encrypted:
+                return None
+            page_count = len(reader.pages)
+        except Exception:
+            return None
+        finally:
+            _release_pdf_reader(reader)
+        if page_count == 0:
+            return None
+
+        output_filename = f"{group_name}_{output_label}_batch{batch_num}.pdf"
+        output_file = os.path.join(output_path, output_filename)
+        shutil.copyfile(pdf_file, output_file)
+
+        if output_to_sources is not None:
+            original = source_file_map.get(pdf_file, pdf_file) if source_file_map else pdf_file
+            output_to_sources[output_file] = [original]
+        if output_page_counts is not None:
+            output_page_counts[output_file] = page_count
+
+        print(f"    Created: {output_filename} (1 PDFs, {page_count} pages)")
+        return output_file
+
     def _save_pdf_batch(
         self,
         pdf_files: List[str],
@@ -830,8 +1204,37 @@ class PDFMerger:
         bookmark_titles: Optional[Dict[str, str]] = None,
         source_file_map: Optional[Dict[str, str]] = None,
         output_to_sources: Optional[Dict[str, List[str]]] = None,
+        output_page_counts: Optional[Dict[str, int]] = None,
     ) -> Optional[str]:
         """Save a batch of PDFs into a single merged PDF"""
+        if len(pdf_files) == 1 and not (bookmark_titles and bookmark_titles.get(pdf_files[0])):
+            copied = self._copy_single_pdf_batch(
+                pdf_files[0],
+                output_path,
+                group_name,
+                batch_num,
+                output_label=output_label,
+                source_file_map=source_file_map,
+                output_to_sources=output_to_sources,
+                output_page_counts=output_page_counts,
+            )
+            if copied:
+                return copied
+
+        if self.backend == "pikepdf":
+            return self._save_pdf_batch_pikepdf(
+                pdf_files,
+                output_path,
+                group_name,
+                batch_num,
+                warnings,
+                output_label=output_label,
+                bookmark_titles=bookmark_titles,
+                source_file_map=source_file_map,
+                output_to_sources=output_to_sources,
+                output_page_counts=output_page_counts,
+            )
+
         writer = PdfWriter()
         total_pages_added = 0
         merged_batch_sources: List[str] = []
@@ -847,10 +1250,12 @@ class PDFMerger:
                 except Exception:
                     pass
         
-        # Add all pages from all PDFs
-        for pdf_file in pdf_files:
+        # Add all pages from all PDFs; the next file is read in the background
+        # while the current one is appended.
+        for pdf_file, prefetched in _prefetch_iter(pdf_files):
+            reader = None
             try:
-                reader = PdfReader(pdf_file)
+                reader = PdfReader(prefetched if prefetched is not None else pdf_file)
                 if reader.is_encrypted:
                     # Try to decrypt with empty password (handles "view-only" PDFs)
                     result = reader.decrypt("")
@@ -864,11 +1269,11 @@ class PDFMerger:
                         )
                         continue
                     # else: successfully decrypted, continue with normal processing
-                page_start = total_pages_added
-                file_pages_added = 0
-                for page in reader.pages:
-                    writer.add_page(page)
-                    file_pages_added += 1
+                page_start = len(writer.pages)
+                # Bulk-append the whole document; outlines are rebuilt below from
+                # bookmark_titles, so the source outline is not imported.
+                writer.append(reader, import_outline=False)
+                file_pages_added = len(writer.pages) - page_start
                 if file_pages_added == 0:
                     _record_warning(
                         warnings,
@@ -882,19 +1287,13 @@ class PDFMerger:
                     merged_batch_sources.append(pdf_file)
                 total_pages_added += file_pages_added
             except Exception as e:
-                # Fallback 1: File may be an image with a .pdf extension
-                pdf_bytes = self._try_convert_image_to_pdf(pdf_file)
-                if not pdf_bytes:
-                    # Fallback 2: File may be an OLE .doc with a .pdf extension
-                    pdf_bytes = self._try_convert_ole_doc_to_pdf(pdf_file)
+                pdf_bytes = self._convert_non_pdf_to_pdf(pdf_file)
                 if pdf_bytes:
                     try:
                         reader = PdfReader(io.BytesIO(pdf_bytes))
-                        page_start = total_pages_added
-                        converted_pages = 0
-                        for page in reader.pages:
-                            writer.add_page(page)
-                            converted_pages += 1
+                        page_start = len(writer.pages)
+                        writer.append(reader, import_outline=False)
+                        converted_pages = len(writer.pages) - page_start
                         total_pages_added += converted_pages
                         if converted_pages == 0:
                             _record_warning(
@@ -925,6 +1324,14 @@ class PDFMerger:
                         error=str(e),
                     )
                     print(f"Warning: Could not merge {pdf_file}: {e}")
+            finally:
+                # Pages are cloned into the writer on append, so the source
+                # reader's buffer and object cache can be dropped right away.
+                # The writer keeps a reference to every appended reader, so
+                # the prefetched bytes must be closed here to be freed.
+                _release_pdf_reader(reader)
+                if prefetched is not None:
+                    prefetched.close()
 
         if total_pages_added == 0:
             _record_warning(
@@ -949,14 +1356,127 @@ class PDFMerger:
                 if original not in mapped_sources:
                     mapped_sources.append(original)
             output_to_sources[output_file] = mapped_sources
+        if output_page_counts is not None:
+            output_page_counts[output_file] = total_pages_added
         
         # Write merged PDF
-        with open(output_file, 'wb') as f:
+        with open(output_file, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as f:
             writer.write(f)
         
         print(f"    Created: {output_filename} ({len(pdf_files)} PDFs, {total_pages_added} pages)")
         return output_file
 
+    def _save_pdf_batch_pikepdf(
+        self,
+        pdf_files: List[str],
+        output_path: str,
+        group_name: str,
+        batch_num: int,
+        warnings: Optional[List[Dict]] = None,
+        output_label: str = "pdfs",
+        bookmark_titles: Optional[Dict[str, str]] = None,
+        source_file_map: Optional[Dict[str, str]] = None,
+        output_to_sources: Optional[Dict[str, List[str]]] = None,
+        output_page_counts: Optional[Dict[str, int]] = None,
+    ) -> Optional[str]:
+        """Save a batch with pikepdf; mirrors _save_pdf_batch's warnings and fallbacks."""
+        merged_batch_sources: List[str] = []
+        bookmarks: List[Tuple[str, int]] = []
+        # qpdf copies page objects lazily, so sources stay open until the save.
+        sources = []
+        dst = pikepdf.new()
+        try:
+            for pdf_file in pdf_files:
+                try:
+                    src = pikepdf.open(pdf_file)
+                except pikepdf.PasswordError:
+                    _record_warning(
+                        warnings,
+                        'pdf_encrypted',
+                        'PDF is password-protected and cannot be merged; skipping',
+                        file=pdf_file,
+                    )
+                    continue
+                except Exception as e:
+                    pdf_bytes = self._convert_non_pdf_to_pdf(pdf_file)
+                    if not pdf_bytes:
+                        _record_warning(
+                            warnings,
+                            'pdf_unreadable',
+                            'Could not read PDF file and fallback conversion failed',
+                            file=pdf_file,
+                            error=str(e),
+                        )
+                        print(f"Warning: Could not merge {pdf_file}: {e}")
+                        continue
+                    try:
+                        src = pikepdf.open(io.BytesIO(pdf_bytes))
+                    except Exception as e2:
+                        _record_warning(
+                            warnings,
+                            'pdf_conversion_failed',
+                            'Could not merge file after fallback conversion',
+                            file=pdf_file,
+                            error=str(e2),
+                        )
+                        print(f"Warning: Could not merge {pdf_file} even after conversion: {e2}")
+                        continue
+                sources.append(src)
+
+                page_start = len(dst.pages)
+                dst.pages.extend(src.pages)
+                if len(dst.pages) == page_start:
+                    _record_warning(
+                        warnings,
+                        'pdf_no_pages',
+                        'PDF contained zero readable pages',
+                        file=pdf_file,
+                    )
+                    continue
+                if bookmark_titles and bookmark_titles.get(pdf_file):
+                    bookmarks.append((bookmark_titles[pdf_file], page_start))
+                merged_batch_sources.append(pdf_file)
+
+            total_pages_added = len(dst.pages)
+            if total_pages_added == 0:
+                _record_warning(
+                    warnings,
+                    'pdf_empty_batch',
+                    'Skipped PDF batch because no readable pages were found',
+                    group=group_name,
+                    batch=batch_num,
+                    file_count=len(pdf_files),
+                )
+                print(f"Warning: Skipping empty PDF batch {batch_num} for group {group_name}")
+                return None
+
+            if bookmarks:
+                with dst.open_outline() as outline:
+                    for title, page_index in bookmarks:
+                        outline.root.append(pikepdf.OutlineItem(title, page_index))
+
+            output_filename = f"{group_name}_{output_label}_batch{batch_num}.pdf"
+            output_file = os.path.join(output_path, output_filename)
+
+            if output_to_sources is not None:
+                mapped_sources: List[str] = []
+                for merged_source in merged_batch_sources:
+                    original = source_file_map.get(merged_source, merged_source) if source_file_map else merged_source
+                    if original not in mapped_sources:
+                        mapped_sources.append(original)
+                output_to_sources[output_file] = mapped_sources
+            if output_page_counts is not None:
+                output_page_counts[output_file] = total_pages_added
+
+            dst.save(output_file, linearize=False)
+        finally:
+            dst.close()
+            for src in sources:
+                src.close()
+
+        print(f"    Created: {output_filename} ({len(pdf_files)} PDFs, {total_pages_added} pages)")
+        return output_file
+
 
 class DOCXMerger:
     """Merges multiple DOCX files into batched output files"""
@@ -965,9 +1485,9 @@ class DOCXMerger:
         self.max_file_size_kb = max_file_size_kb
         self.max_file_size_bytes = max_file_size_kb * 1024
         
-    def estimate_batch_count(self, docx_files: List[str]) -> int:
+    def estimate_batch_count(self, docx_files: List[Union[str, Tuple[str, int]]]) -> int:
         """Estimate how many output batches a DOCX merge operation will create."""
-        docx_files = sorted(docx_files)
+        docx_files = sorted(docx_files, key=lambda entry: _split_file_entry(entry)[0])
         if not docx_files:
             return 0
 
@@ -976,11 +1496,13 @@ class DOCXMerger:
         current_batch_size = 0
         current_batch_words = 0
 
-        for docx_file in docx_files:
-            try:
-                file_size = os.path.getsize(docx_file)
-            except OSError:
-                file_size = self.max_file_size_bytes
+        for entry in docx_files:
+            docx_file, file_size = _split_file_entry(entry)
+            if file_size is None:
+                try:
+                    file_size = os.path.getsize(docx_file)
+                except OSError:
+                    file_size = self.max_file_size_bytes
 
             file_words = self._estimate_docx_word_count(docx_file)
 
@@ -1013,18 +1535,21 @@ class DOCXMerger:
 
     def merge_docx(
         self,
-        docx_files: List[str],
+        docx_files: List[Union[str, Tuple[str, int]]],
         output_path: str,
         group_name: str,
         warnings: Optional[List[Dict]] = None,
+        executor: Optional[Executor] = None,
     ) -> List[str]:
         """
         Merge DOCX files into batches, staying under size limit
         
         Args:
-            docx_files: List of DOCX file paths to merge
+            docx_files: List of DOCX file paths (or (path, size) tuples) to merge
             output_path: Directory to save merged DOCX files
             group_name: Name prefix for output files
+            executor: Optional process pool used to open and parse each
+                source document in parallel before it is grafted
             
         Returns:
             List of created output file paths
@@ -1036,7 +1561,7 @@ class DOCXMerger:
         output_files = []
 
         # Sort files by name
-        docx_files = sorted(docx_files)
+        docx_files = sorted(docx_files, key=lambda entry: _split_file_entry(entry)[0])
 
         current_batch: List[str] = []
         current_batch_size = 0
@@ -1049,7 +1574,7 @@ class DOCXMerger:
             if not current_batch:
                 return
             output_file = self._save_docx_batch(
-                current_batch, output_path, group_name, batch_num, warnings
+                current_batch, output_path, group_name, batch_num, warnings, executor=executor
             )
             if output_file:
                 output_files.append(output_file)
@@ -1058,18 +1583,20 @@ class DOCXMerger:
             current_batch_size = 0
             current_batch_words = 0
 
-        for docx_file in docx_files:
-            try:
-                file_size = os.path.getsize(docx_file)
-            except OSError as exc:
-                _record_warning(
-                    warnings,
-                    'docx_stat_failed',
-                    'Could not determine document file size; using max batch size for pre-allocation',
-                    file=docx_file,
-                    error=str(exc),
-                )
-                file_size = self.max_file_size_bytes
+        for entry in docx_files:
+            docx_file, file_size = _split_file_entry(entry)
+            if file_size is None:
+                try:
+                    file_size = os.path.getsize(docx_file)
+                except OSError as exc:
+                    _record_warning(
+                        warnings,
+                        'docx_stat_failed',
+                        'Could not determine document file size; using max batch size for pre-allocation',
+                        file=docx_file,
+                        error=str(exc),
+                    )
+                    file_size = self.max_file_size_bytes
 
             # Estimate word count from paragraph count (fast, no full text extraction)
             file_words = self._estimate_docx_word_count(docx_file)
@@ -1104,36 +1631,37 @@ class DOCXMerger:
 
         return output_files
     
-    def _try_extract_docx_text(self, file_path: str) -> Optional[str]:
+    def _try_extract_docx_text(self, file_path: Union[str, IO[bytes]]) -> Optional[str]:
         """
         Fallback: extract raw paragraph text from word/document.xml inside the zip.
         Works even when python-docx can't open the file due to broken relationships.
+        Accepts a path or an already-read file object.
         """
         import zipfile
         import xml.etree.ElementTree as ET
 
         try:
             with zipfile.ZipFile(file_path, 'r') as z:
-                # Find word/document.xml (may be at a different path in some files)
-                candidates = [n for n in z.namelist() if n.endswith('document.xml')]
-                if not candidates:
+                entry = _docx_document_entry(z)
+                if entry is None:
                     return None
-                xml_bytes = z.read(candidates[0])
-            root = ET.fromstring(xml_bytes)
-            paragraphs = []
-            for para in root.iter('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p'):
-                texts = [t.text or '' for t in para.iter('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t')]
-                line = ''.join(texts)
-                paragraphs.append(line)
+                paragraphs = []
+                # Stream the XML and clear each paragraph once read so memory
+                # stays bounded by one paragraph rather than the whole tree.
+                with z.open(entry) as xml_stream:
+                    for _, elem in ET.iterparse(xml_stream, events=('end',)):
+                        if elem.tag == _W_P:
+                            paragraphs.append(''.join(t.text or '' for t in elem.iter(_W_T)))
+                            elem.clear()
             return '\n'.join(paragraphs) if paragraphs else None
         except Exception:
             return None
 
-    def _try_extract_ole_text(self, file_path: str) -> Optional[str]:
+    def _try_extract_ole_text(self, file_path: Union[str, IO[bytes]]) -> Optional[str]:
         """
         Fallback: extract text from OLE (legacy .doc) compound files.
         These may appear as OOXML theme-only zips but contain actual content
-        in OLE streams like WordDocument and 1Table.
+        in OLE streams like WordDocument and 1Table. Accepts a path or file object.
         """
         try:
             import olefile
@@ -1146,18 +1674,7 @@ class DOCXMerger:
             text = ""
             if ole.exists('WordDocument'):
                 raw = ole.openstream('WordDocument').read()
-                text_chunks = []
-                current_chunk = []
-                for byte in raw:
-                    if 32 <= byte < 127 or byte in (10, 13, 9):
-                        current_chunk.append(chr(byte))
-                    else:
-                        if len(current_chunk) > 3:
-                            text_chunks.append(''.join(current_chunk))
-                        current_chunk = []
-                if len(current_chunk) > 3:
-                    text_chunks.append(''.join(current_chunk))
-                text = '\n'.join(text_chunks)
+                text = _extract_printable_runs(raw)
             ole.close()
             return text.strip() if text.strip() else None
         except Exception:
@@ -1169,12 +1686,16 @@ class DOCXMerger:
             import zipfile
             import xml.etree.ElementTree as ET
             with zipfile.ZipFile(file_path, 'r') as z:
-                candidates = [n for n in z.namelist() if n.endswith('document.xml')]
-                if not candidates:
+                entry = _docx_document_entry(z)
+                if entry is None:
                     return 0
-                root = ET.fromstring(z.read(candidates[0]))
-                ns = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
-                para_count = sum(1 for _ in root.iter(f'{ns}p'))
+                para_count = 0
+                # Count paragraphs as they stream past instead of building the tree.
+                with z.open(entry) as xml_stream:
+                    for _, elem in ET.iterparse(xml_stream, events=('end',)):
+                        if elem.tag == _W_P:
+                            para_count += 1
+                            elem.clear()
                 return para_count * 15
         except Exception:
             return 0
@@ -1247,7 +1768,8 @@ class DOCXMerger:
 
             output_filename = f"{group_name}_documents_batch{batch_num}.docx"
             output_file = os.path.join(output_path, output_filename)
-            merged_doc.save(output_file)
+            with open(output_file, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as f:
+                merged_doc.save(f)
 
             out_size_mb = os.path.getsize(output_file) / (1024 * 1024)
             est_words = len(chunk_elements) * words_per_element
@@ -1258,6 +1780,58 @@ class DOCXMerger:
 
         return output_files
 
+    def _load_docx_source(self, docx_file: str) -> Tuple[Any, Optional[str], Optional[Exception]]:
+        """
+        Open one DOCX/DOC through the recovery chain.
+        Returns (document, raw_text, open_error); document is None when only
+        raw text could be salvaged, and both are None when nothing could.
+        """
+        source_doc = None
+        raw_text = None
+        open_error = None
+
+        # Attempt 1: open normally.
+        try:
+            source_doc = Document(docx_file)
+        except Exception as e1:
+            open_error = e1
+
+            # Attempt 2: read the bytes once and retry from memory.
+            # Handles .doc files that are actually OOXML with wrong extension;
+            # the later fallbacks reuse the same bytes instead of reopening.
+            data = None
+            try:
+                with open(docx_file, 'rb') as fh:
+                    data = fh.read()
+                source_doc = Document(io.BytesIO(data))
+                print(f"    Recovered (as .docx): {os.path.basename(docx_file)}")
+            except Exception:
+                source_doc = None
+
+            if source_doc is None:
+                # Attempt 3: extract raw text from the zip's document.xml.
+                raw_text = self._try_extract_docx_text(io.BytesIO(data) if data is not None else docx_file)
+                if raw_text:
+                    print(f"    Recovered (raw text): {os.path.basename(docx_file)}")
+                else:
+                    # Attempt 4: extract text from OLE compound document.
+                    raw_text = self._try_extract_ole_text(io.BytesIO(data) if data is not None else docx_file)
+                    if raw_text:
+                        print(f"    Recovered (OLE text): {os.path.basename(docx_file)}")
+
+        return source_doc, raw_text, open_error
+
+    @staticmethod
+    def _body_elements(source: Any) -> List[Any]:
+        """Body children to graft, from an open Document or serialized worker output."""
+        if isinstance(source, list):
+            return [parse_xml(element_xml) for element_xml in source]
+        return [
+            deepcopy(element)
+            for element in source.element.body.iterchildren()
+            if not element.tag.endswith('}sectPr')
+        ]
+
     def _save_docx_batch(
         self,
         docx_files: List[str],
@@ -1265,54 +1839,31 @@ class DOCXMerger:
         group_name: str,
         batch_num: int,
         warnings: Optional[List[Dict]] = None,
+        executor: Optional[Executor] = None,
     ) -> Optional[str]:
-        """Save a batch of DOCX files into a single merged document."""
-        import tempfile
-        import shutil
-
+        """
+        Save a batch of DOCX files into a single merged document.
+        With an executor, sources are opened and parsed in worker processes and
+        only the grafting of their body elements happens here.
+        """
         merged_doc = Document()
         merged_docs_count = 0
 
-        for docx_file in docx_files:
-            source_doc = None
-            raw_text = None
-            open_error = None
-
-            # Attempt 1: open normally.
-            try:
-                source_doc = Document(docx_file)
-            except Exception as e1:
-                open_error = e1
-
-                # Attempt 2: copy to a temp .docx and retry.
-                # Handles .doc files that are actually OOXML with wrong extension.
-                tmp_path = None
+        def _collect_loaded(futures):
+            for docx_file, future in zip(docx_files, futures):
                 try:
-                    tmp_fd, tmp_path = tempfile.mkstemp(suffix='.docx')
-                    os.close(tmp_fd)
-                    shutil.copy2(docx_file, tmp_path)
-                    source_doc = Document(tmp_path)
-                    print(f"    Recovered (as .docx): {os.path.basename(docx_file)}")
+                    yield future.result()
                 except Exception:
-                    source_doc = None
-                finally:
-                    if tmp_path and os.path.exists(tmp_path):
-                        try:
-                            os.remove(tmp_path)
-                        except Exception:
-                            pass
+                    # A failed worker is retried here, so a bad source is
+                    # skipped with the same warning as on the serial path.
+                    yield self._load_docx_source(docx_file)
 
-                if source_doc is None:
-                    # Attempt 3: extract raw text from the zip's document.xml.
-                    raw_text = self._try_extract_docx_text(docx_file)
-                    if raw_text:
-                        print(f"    Recovered (raw text): {os.path.basename(docx_file)}")
-                    else:
-                        # Attempt 4: extract text from OLE compound document.
-                        raw_text = self._try_extract_ole_text(docx_file)
-                        if raw_text:
-                            print(f"    Recovered (OLE text): {os.path.basename(docx_file)}")
+        if executor is not None:
+            loaded = _collect_loaded([executor.submit(_load_docx_body, docx_file) for docx_file in docx_files])
+        else:
+            loaded = (self._load_docx_source(docx_file) for docx_file in docx_files)
 
+        for docx_file, (source_doc, raw_text, open_error) in zip(docx_files, loaded):
             if source_doc is None and not raw_text:
                 _record_warning(
                     warnings,
@@ -1334,11 +1885,7 @@ class DOCXMerger:
                 continue
 
             try:
-                elements = [
-                    deepcopy(element)
-                    for element in source_doc.element.body.iterchildren()
-                    if not element.tag.endswith('}sectPr')
-                ]
+                elements = self._body_elements(source_doc)
                 if not elements:
                     _record_warning(
                         warnings,
@@ -1383,7 +1930,8 @@ class DOCXMerger:
         output_file = os.path.join(output_path, output_filename)
 
         # Save merged document
-        merged_doc.save(output_file)
+        with open(output_file, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as f:
+            merged_doc.save(f)
 
         print(f"    Created: {output_filename} ({merged_docs_count} documents)")
         return output_file
@@ -1429,6 +1977,7 @@ class EmailExtractor:
                 'to': msg.to or '',
                 'cc': msg.cc or '',
                 'date': msg.date,
+                'date_sort': EmailThreader.normalize_date(msg.date),
                 'body': msg.body or '',
                 'attachments': attachments,
             }
@@ -1466,14 +2015,16 @@ class EmailExtractor:
                     }
                 )
             body_part = msg.get_body(preferencelist=('plain', 'html'))
-            body_text = body_part.get_content() if body_part else ''
+            body_text = body_part.get_content() if body_part is not None else ''
+            date_header = msg.get('date')
 
             return {
                 'subject': msg.get('subject', '(No Subject)'),
                 'from': msg.get('from', ''),
                 'to': msg.get('to', ''),
                 'cc': msg.get('cc', ''),
-                'date': msg.get('date'),
+                'date': date_header,
+                'date_sort': EmailThreader.normalize_date(date_header),
                 'body': body_text,
                 'attachments': attachments,
             }
@@ -1491,26 +2042,43 @@ class EmailThreader:
         if not subject:
             return ""
         
-        # Remove prefixes like RE:, FW:, FWD:, etc.
-        subject = re.sub(r'^(RE|FW|FWD):\s*', '', subject, flags=re.IGNORECASE)
-        subject = re.sub(r'\s+', ' ', subject).strip()
+        # Remove prefixes like RE:, FW:, FWD:, including stacked ones
+        subject = _SUBJECT_PREFIX_RE.sub('', subject)
+        subject = _WHITESPACE_RE.sub(' ', subject).strip()
         return subject.lower()
 
+    @staticmethod
+    def normalize_subjects(subjects: List[str]) -> List[str]:
+        """Normalize a list of subjects; equivalent to mapping normalize_subject."""
+        prefix_sub = _SUBJECT_PREFIX_RE.sub
+        whitespace_sub = _WHITESPACE_RE.sub
+        return [
+            whitespace_sub(' ', prefix_sub('', subject)).strip().lower() if subject else ""
+            for subject in subjects
+        ]
+
     @staticmethod
     def normalize_date(date_value) -> datetime:
         """Normalize date values to naive UTC datetimes for safe sorting."""
         if isinstance(date_value, datetime):
             parsed = date_value
         elif isinstance(date_value, str) and date_value.strip():
-            if not HAS_DATEUTIL:
-                raise RuntimeError(
-                    "python-dateutil is required for email date parsing. "
-                    "Install it with: pip install python-dateutil"
-                )
+            # RFC 2822 headers (the common case) parse with the stdlib; only
+            # other formats need dateutil.
             try:
-                parsed = date_parser.parse(date_value)
-            except (ValueError, TypeError, OverflowError):
-                return datetime.min
+                parsed = parsedate_to_datetime(date_value)
+            except (ValueError, TypeError, IndexError):
+                parsed = None
+            if parsed is None:
+                if not HAS_DATEUTIL:
+                    raise RuntimeError(
+                        "python-dateutil is required for email date parsing. "
+                        "Install it with: pip install python-dateutil"
+                    )
+                try:
+                    parsed = date_parser.parse(date_value)
+                except (ValueError, TypeError, OverflowError):
+                    return datetime.min
         else:
             return datetime.min
 
@@ -1530,14 +2098,20 @@ class EmailThreader:
         """
         threads = defaultdict(list)
         
-        for email in email_data:
-            normalized_subject = self.normalize_subject(email.get('subject', ''))
+        normalized_subjects = self.normalize_subjects([email.get('subject', '') for email in email_data])
+        for email, normalized_subject in zip(email_data, normalized_subjects):
             thread_key = normalized_subject or f"no_subject_{email.get('file_path', '')}"
             threads[thread_key].append(email)
         
-        # Sort emails within each thread by date
-        for thread_emails in threads.values():
-            thread_emails.sort(key=lambda e: self.normalize_date(e.get('date')))
+        # Sort emails within each thread by date. Extractors pre-parse
+        # 'date_sort'; anything else is normalized once per email here.
+        for thread_key, thread_emails in threads.items():
+            decorated = [
+                (email['date_sort'] if 'date_sort' in email else self.normalize_date(email.get('date')), email)
+                for email in thread_emails
+            ]
+            decorated.sort(key=itemgetter(0))
+            threads[thread_key] = [email for _, email in decorated]
         
         return dict(threads)
 
@@ -1549,6 +2123,7 @@ class FolderAnalyzer:
     def analyze_structure(
         root_path: str,
         exclude_paths: Optional[List[str]] = None,
+        file_sizes: Optional[Dict[str, int]] = None,
     ) -> Dict[str, List[str]]:
         """
         Analyze folder structure and group files by parent folder
@@ -1556,6 +2131,8 @@ class FolderAnalyzer:
         Args:
             root_path: Root directory to analyze
             exclude_paths: Optional list of directories to exclude from traversal
+            file_sizes: Optional dict filled with path -> size in bytes, taken from
+                the directory scan so later stages do not need to stat again
             
         Returns:
             Dict mapping group_name to list of file paths
@@ -1574,33 +2151,55 @@ class FolderAnalyzer:
                     return True
             return False
 
-        for dirpath, dirnames, filenames in os.walk(root_path):
-            if is_excluded(dirpath):
-                dirnames[:] = []
+        for entry, group_name in FolderAnalyzer._walk(root_path, is_excluded):
+            # Files in root directory form the 'root' group; anything deeper is
+            # grouped under its first subfolder.
+            groups[group_name or 'root'].append(entry.path)
+            if file_sizes is not None:
+                try:
+                    file_sizes[entry.path] = entry.stat().st_size
+                except OSError:
+                    pass
+
+        return dict(groups)
+
+    @staticmethod
+    def _walk(
+        root_path: str,
+        is_excluded: Callable[[str], bool],
+    ) -> Iterator[Tuple[os.DirEntry, Optional[str]]]:
+        """
+        Yield (file entry, first subfolder name) pairs under root_path.
+
+        Uses an explicit stack instead of recursion so deep trees cannot hit the
+        recursion limit. Order matches os.walk top-down: a directory's files come
+        before its subdirectories, which are visited in scan order. Symlinked
+        directories are not entered, as with os.walk(followlinks=False).
+        """
+        stack: List[Tuple[str, Optional[str]]] = [(root_path, None)]
+        while stack:
+            dir_path, group_name = stack.pop()
+            if is_excluded(dir_path):
+                continue
+            try:
+                with os.scandir(dir_path) as entries:
+                    entries = list(entries)
+            except OSError:
                 continue
 
-            dirnames[:] = [
-                dirname
-                for dirname in dirnames
-                if not is_excluded(os.path.join(dirpath, dirname))
-            ]
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        subdirs.append((entry.path, group_name or entry.name))
+                    continue
+                yield entry, group_name
 
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                
-                # Determine group name from folder structure
-                rel_path = os.path.relpath(dirpath, root_path)
-                
-                if rel_path == '.':
-                    # Files in root directory
-                    group_name = 'root'
-                else:
-                    # Use first subfolder as group name
-                    group_name = rel_path.split(os.sep)[0]
-                
-                groups[group_name].append(file_path)
-        
-        return dict(groups)
+            stack.extend(reversed(subdirs))
 
 
 class ZipArchiveProcessor:
@@ -1858,6 +2457,116 @@ class ZipArchiveProcessor:
         return stats
 
 
+def _default_max_workers() -> int:
+    """Leave one core free for the GUI/main thread."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def _email_extract_workers() -> int:
+    """Thread count for email extraction; override with MERGER_EMAIL_THREADS."""
+    override = os.environ.get("MERGER_EMAIL_THREADS", "").strip()
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _save_pdf_batch_worker(
+    merger: PDFMerger,
+    batch: List[str],
+    output_path: str,
+    group_name: str,
+    batch_num: int,
+    output_label: str,
+    bookmark_titles: Optional[Dict[str, str]],
+    source_file_map: Optional[Dict[str, str]],
+) -> Tuple[Optional[str], List[Dict], Dict[str, List[str]], Dict[str, int]]:
+    """Save one PDF batch in a worker process; returns (output, warnings, output_to_sources, output_page_counts)."""
+    warnings: List[Dict] = []
+    output_to_sources: Dict[str, List[str]] = {}
+    output_page_counts: Dict[str, int] = {}
+    output_file = merger._save_pdf_batch(
+        batch,
+        output_path,
+        group_name,
+        batch_num,
+        warnings,
+        output_label=output_label,
+        bookmark_titles=bookmark_titles,
+        source_file_map=source_file_map,
+        output_to_sources=output_to_sources,
+        output_page_counts=output_page_counts,
+    )
+    return output_file, warnings, output_to_sources, output_page_counts
+
+
+def _load_docx_body(docx_file: str) -> Tuple[Optional[List[bytes]], Optional[str], Optional[str]]:
+    """
+    Open one DOCX/DOC in a worker process; returns (body_xml, raw_text, open_error)
+    with the body children serialized so the parent only grafts them.
+    """
+    source_doc, raw_text, open_error = DOCXMerger()._load_docx_source(docx_file)
+    body_xml = None
+    if source_doc is not None:
+        body_xml = [
+            etree.tostring(element)
+            for element in source_doc.element.body.iterchildren()
+            if not element.tag.endswith('}sectPr')
+        ]
+    return body_xml, raw_text, str(open_error) if open_error else None
+
+
+def _merge_pdf_group_worker(
+    merger: PDFMerger,
+    pdf_files: List[Union[str, Tuple[str, int]]],
+    output_path: str,
+    group_name: str,
+) -> Tuple[List[str], List[Dict]]:
+    """Merge one group's PDFs in a worker process; returns (outputs, warnings)."""
+    warnings: List[Dict] = []
+    outputs = merger.merge_pdfs(
+        pdf_files,
+        output_path,
+        group_name,
+        warnings=warnings,
+    )
+    return outputs, warnings
+
+
+class _LazyProcessPool:
+    """Process pool shared by one merge run; nothing is spawned until first use."""
+
+    def __init__(self, factory: Callable[[int], Executor], max_workers: int):
+        self._factory = factory
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+        self._broken = False
+
+    def get(self) -> Optional[Executor]:
+        """Return the pool, or None once a worker crash has broken it."""
+        if self._executor is not None and getattr(self._executor, '_broken', False):
+            self.discard()
+        if self._broken:
+            return None
+        if self._executor is None:
+            self._executor = self._factory(self.max_workers)
+        return self._executor
+
+    def discard(self) -> None:
+        """Drop a broken pool; the rest of the run merges in-process."""
+        self._broken = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
 class MergeOrchestrator:
     """Coordinates the entire merging process"""
     
@@ -1891,9 +2600,11 @@ class MergeOrchestrator:
         email_batch_name_prefix="emails_batch",
         zip_max_extract_bytes=2 * 1024 ** 3,  # 2 GB default extraction budget
         word_convert_timeout_seconds=120,
+        max_workers=None,
+        pdf_backend="pypdf",
     ):
         self.max_file_size_kb = max_file_size_kb
-        self.pdf_merger = PDFMerger(max_file_size_kb)
+        self.pdf_merger = PDFMerger(max_file_size_kb, backend=pdf_backend)
         self.email_extractor = EmailExtractor()
         self.email_threader = EmailThreader()
         self.folder_analyzer = FolderAnalyzer()
@@ -1926,6 +2637,7 @@ class MergeOrchestrator:
         self.email_batch_name_prefix = email_batch_name_prefix
         self.zip_max_extract_bytes = int(zip_max_extract_bytes)
         self.word_convert_timeout_seconds = max(10, int(word_convert_timeout_seconds))
+        self.max_workers = _default_max_workers() if max_workers is None else max(1, int(max_workers))
 
     def merge_documents(
         self,
@@ -2039,7 +2751,12 @@ class MergeOrchestrator:
                 exclude_paths.append(output_path)
                 print(f"Excluding output folder from scan: {output_path}")
 
-            groups = self.folder_analyzer.analyze_structure(working_input_path, exclude_paths=exclude_paths)
+            input_file_sizes: Dict[str, int] = {}
+            groups = self.folder_analyzer.analyze_structure(
+                working_input_path,
+                exclude_paths=exclude_paths,
+                file_sizes=input_file_sizes,
+            )
             print(f"Found {len(groups)} groups to process")
             run_logger.log("info", "groups_analyzed", "Folder analysis complete", group_count=len(groups))
             warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
@@ -2056,141 +2773,223 @@ class MergeOrchestrator:
             zip_temp_dirs.extend(extracted_zip_temp_dirs)
             warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
 
-            for group_name, files in sorted(groups.items()):
-                if cancel_event is not None and cancel_event.is_set():
-                    run_logger.log("warning", "run_cancelled", "Merge cancelled by user")
-                    break
-                if not files:
-                    continue
+            # One pool per run: spawned workers re-import this module, so they are
+            # started at most once and reused by every group and batch merge.
+            pdf_pool = self._create_pdf_pool()
+            pool_pdf_groups = pdf_pool is not None and self._count_pdf_groups(groups) >= 2
+            # (group, index in output_files where the group's PDFs belong, pdfs, future)
+            pending_pdf_merges: List[Tuple[str, int, List[Any], Future]] = []
+            reserved_pdf_outputs = 0
+            try:
+                for group_name, files in sorted(groups.items()):
+                    if cancel_event is not None and cancel_event.is_set():
+                        run_logger.log("warning", "run_cancelled", "Merge cancelled by user")
+                        break
+                    if not files:
+                        continue
 
-                print(f"\nProcessing group: {group_name}")
-                run_logger.log("info", "group_start", "Processing group", group=group_name, file_count=len(files))
-                group_files = sorted(files)
-
-                supported_files = [f for f in group_files if self._is_supported_processable_file(f)]
-                unsupported_files = [f for f in group_files if f not in supported_files]
-                if unsupported_files and self.unprocessed_include_source_files:
-                    if group_name in zip_group_meta:
-                        relocated = self._relocate_unsupported_files(
-                            files_to_relocate=unsupported_files,
-                            target_root=unprocessed_dir,
-                            target_prefix="",
-                            base_path=zip_group_meta[group_name]["extraction_root"],
-                            action="move",
-                            reason="unsupported_zip_file_moved",
-                            origin="zip_extract",
-                            stage="classification",
+                    print(f"\nProcessing group: {group_name}")
+                    run_logger.log("info", "group_start", "Processing group", group=group_name, file_count=len(files))
+                    group_files = sorted(files)
+
+                    supported_files = [f for f in group_files if self._is_supported_processable_file(f)]
+                    unsupported_files = [f for f in group_files if f not in supported_files]
+                    if unsupported_files and self.unprocessed_include_source_files:
+                        if group_name in zip_group_meta:
+                            relocated = self._relocate_unsupported_files(
+                                files_to_relocate=unsupported_files,
+                                target_root=unprocessed_dir,
+                                target_prefix="",
+                                base_path=zip_group_meta[group_name]["extraction_root"],
+                                action="move",
+                                reason="unsupported_zip_file_moved",
+                                origin="zip_extract",
+                                stage="classification",
+                                warnings=warnings,
+                                run_logger=run_logger,
+                                success_event="unsupported_zip_file_relocated",
+                                flatten=True,
+                            )
+                            unprocessed_files.extend(relocated)
+                            moved_unprocessed.extend(
+                                {
+                                    "source": item["source"],
+                                    "destination": item["destination"],
+                                    "reason": item["reason"],
+                                }
+                                for item in relocated
+                            )
+                        elif self.relocate_unsupported_input_files:
+                            relocated = self._relocate_unsupported_files(
+                                files_to_relocate=unsupported_files,
+                                target_root=unprocessed_dir,
+                                target_prefix="",
+                                base_path=working_input_path,
+                                action=self.unsupported_input_action,
+                                reason="unsupported_input_file_relocated",
+                                origin="input",
+                                stage="classification",
+                                warnings=warnings,
+                                run_logger=run_logger,
+                                success_event="unsupported_input_file_relocated",
+                                flatten=True,
+                            )
+                            unprocessed_files.extend(relocated)
+                    group_files = supported_files
+
+                    buckets: Dict[str, List[Any]] = {'pdf': [], 'docx': [], 'email': []}
+                    for f in group_files:
+                        kind = _file_kind(f)
+                        if kind:
+                            buckets[kind].append(f)
+                    # Reuse sizes from the folder scan so estimation and merging need not stat again.
+                    pdfs = _with_file_sizes(buckets['pdf'], input_file_sizes)
+                    word_docs = buckets['docx']
+                    emails = buckets['email']
+
+                    if pdfs and self.process_pdfs:
+                        print(f"  Merging {len(pdfs)} PDF files...")
+                        run_logger.log("info", "pdf_merge_start", "Starting PDF merge", group=group_name, count=len(pdfs))
+                        required_pdf_outputs = self.pdf_merger.estimate_batch_count(pdfs)
+                        self._ensure_output_capacity(
+                            required_pdf_outputs,
+                            len(output_files) + reserved_pdf_outputs,
+                            f"group '{group_name}' PDF files",
+                        )
+                        group_future = None
+                        group_executor = pdf_pool.get() if pool_pdf_groups else None
+                        if group_executor is not None:
+                            try:
+                                group_future = group_executor.submit(
+                                    _merge_pdf_group_worker,
+                                    self.pdf_merger,
+                                    pdfs,
+                                    processed_dir,
+                                    group_name,
+                                )
+                            except BrokenExecutor as exc:
+                                _record_warning(
+                                    warnings,
+                                    'pdf_merge_worker_failed',
+                                    'PDF worker pool is unavailable; merging group PDFs in-process instead',
+                                    group=group_name,
+                                    error=str(exc),
+                                )
+                                pdf_pool.discard()
+                        if group_future is not None:
+                            # Merged in a worker process; results are collected after the loop.
+                            pending_pdf_merges.append((group_name, len(output_files), pdfs, group_future))
+                            reserved_pdf_outputs += required_pdf_outputs
+                        else:
+                            pdf_outputs = self._merge_pdfs_in_batches(
+                                pdfs,
+                                processed_dir,
+                                group_name,
+                                required_pdf_outputs,
+                                pdf_pool=pdf_pool,
+                                warnings=warnings,
+                            )
+                            output_files.extend(pdf_outputs)
+                            run_logger.log("info", "pdf_merge_end", "Completed PDF merge", group=group_name, outputs=len(pdf_outputs))
+                            warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
+
+                    if word_docs and self.process_docx:
+                        print(f"  Processing {len(word_docs)} Word document files...")
+                        run_logger.log("info", "word_convert_start", "Starting Word conversion", group=group_name, count=len(word_docs))
+
+                        def word_progress_update(message: str) -> None:
+                            _safe_progress(progress_callback, file_count, total_input_files, message)
+
+                        doc_outputs, doc_output_to_sources, conversion_summary = self._process_word_documents(
+                            word_docs,
+                            processed_dir,
+                            group_name,
+                            len(output_files) + reserved_pdf_outputs,
                             warnings=warnings,
+                            progress_callback=word_progress_update,
+                            progress_interval=self.word_progress_interval,
                             run_logger=run_logger,
-                            success_event="unsupported_zip_file_relocated",
-                            flatten=True,
+                            pdf_pool=pdf_pool,
                         )
-                        unprocessed_files.extend(relocated)
-                        moved_unprocessed.extend(
-                            {
-                                "source": item["source"],
-                                "destination": item["destination"],
-                                "reason": item["reason"],
-                            }
-                            for item in relocated
+                        output_files.extend(doc_outputs)
+                        output_to_sources.update(doc_output_to_sources)
+                        word_conversion_summary['attempted'] += conversion_summary['attempted']
+                        word_conversion_summary['converted'] += conversion_summary['converted']
+                        word_conversion_summary['failed'] += conversion_summary['failed']
+                        run_logger.log("info", "word_convert_end", "Completed Word conversion", group=group_name, outputs=len(doc_outputs))
+                        warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
+
+                    if emails and self.process_emails:
+                        print(f"  Processing {len(emails)} email files...")
+                        run_logger.log("info", "email_thread_start", "Starting email threading", group=group_name, count=len(emails))
+                        email_threads, email_extract_stats = self._prepare_email_threads(
+                            emails,
+                            warnings=warnings,
                         )
-                    elif self.relocate_unsupported_input_files:
-                        relocated = self._relocate_unsupported_files(
-                            files_to_relocate=unsupported_files,
-                            target_root=unprocessed_dir,
-                            target_prefix="",
-                            base_path=working_input_path,
-                            action=self.unsupported_input_action,
-                            reason="unsupported_input_file_relocated",
-                            origin="input",
-                            stage="classification",
+                        email_summary['parsed_total'] += email_extract_stats.get('parsed_total', 0)
+                        email_summary['failed_total'] += email_extract_stats.get('failed_total', 0)
+                        email_summary['attachment_refs_total'] += email_extract_stats.get('attachment_refs_total', 0)
+                        warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
+                        email_outputs, email_batch_stats = self._write_email_outputs(
+                            threads=email_threads,
+                            output_path=processed_dir,
+                            group_name=group_name,
+                            current_output_count=len(output_files) + reserved_pdf_outputs,
                             warnings=warnings,
                             run_logger=run_logger,
-                            success_event="unsupported_input_file_relocated",
-                            flatten=True,
                         )
-                        unprocessed_files.extend(relocated)
-                group_files = supported_files
-
-                pdfs = [f for f in group_files if f.lower().endswith('.pdf')]
-                word_docs = [f for f in group_files if f.lower().endswith(('.docx', '.doc'))]
-                emails = [f for f in group_files if f.lower().endswith(('.msg', '.eml'))]
-
-                if pdfs and self.process_pdfs:
-                    print(f"  Merging {len(pdfs)} PDF files...")
-                    run_logger.log("info", "pdf_merge_start", "Starting PDF merge", group=group_name, count=len(pdfs))
-                    required_pdf_outputs = self.pdf_merger.estimate_batch_count(pdfs)
-                    self._ensure_output_capacity(
-                        required_pdf_outputs,
-                        len(output_files),
-                        f"group '{group_name}' PDF files",
-                    )
-                    pdf_outputs = self.pdf_merger.merge_pdfs(
-                        pdfs,
-                        processed_dir,
-                        group_name,
-                        warnings=warnings,
-                    )
-                    output_files.extend(pdf_outputs)
-                    run_logger.log("info", "pdf_merge_end", "Completed PDF merge", group=group_name, outputs=len(pdf_outputs))
-                    warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
-
-                if word_docs and self.process_docx:
-                    print(f"  Processing {len(word_docs)} Word document files...")
-                    run_logger.log("info", "word_convert_start", "Starting Word conversion", group=group_name, count=len(word_docs))
-
-                    def word_progress_update(message: str) -> None:
-                        _safe_progress(progress_callback, file_count, total_input_files, message)
-
-                    doc_outputs, doc_output_to_sources, conversion_summary = self._process_word_documents(
-                        word_docs,
-                        processed_dir,
-                        group_name,
-                        len(output_files),
-                        warnings=warnings,
-                        progress_callback=word_progress_update,
-                        progress_interval=self.word_progress_interval,
-                        run_logger=run_logger,
-                    )
-                    output_files.extend(doc_outputs)
-                    output_to_sources.update(doc_output_to_sources)
-                    word_conversion_summary['attempted'] += conversion_summary['attempted']
-                    word_conversion_summary['converted'] += conversion_summary['converted']
-                    word_conversion_summary['failed'] += conversion_summary['failed']
-                    run_logger.log("info", "word_convert_end", "Completed Word conversion", group=group_name, outputs=len(doc_outputs))
+                        output_files.extend(email_outputs)
+                        email_summary['threads_total'] += email_batch_stats.get('threads_total', 0)
+                        email_summary['batches_total'] += email_batch_stats.get('batches_total', 0)
+                        email_summary['output_total_bytes'] += email_batch_stats.get('output_total_bytes', 0)
+                        email_summary['batch_to_threads'].update(email_batch_stats.get('batch_to_threads', {}))
+                        run_logger.log("info", "email_thread_end", "Completed email threading", group=group_name, outputs=len(email_outputs))
+                        warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
+
+                    file_count += group_file_weights.get(group_name, 0)
+                    _safe_progress(progress_callback, file_count, total_input_files, f"Processed {group_name}")
+                    run_logger.log("info", "group_end", "Finished group", group=group_name, processed=file_count, total=total_input_files)
                     warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
-
-                if emails and self.process_emails:
-                    print(f"  Processing {len(emails)} email files...")
-                    run_logger.log("info", "email_thread_start", "Starting email threading", group=group_name, count=len(emails))
-                    email_threads, email_extract_stats = self._prepare_email_threads(
-                        emails,
-                        warnings=warnings,
-                    )
-                    email_summary['parsed_total'] += email_extract_stats.get('parsed_total', 0)
-                    email_summary['failed_total'] += email_extract_stats.get('failed_total', 0)
-                    email_summary['attachment_refs_total'] += email_extract_stats.get('attachment_refs_total', 0)
-                    warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
-                    email_outputs, email_batch_stats = self._write_email_outputs(
-                        threads=email_threads,
-                        output_path=processed_dir,
-                        group_name=group_name,
-                        current_output_count=len(output_files),
-                        warnings=warnings,
-                        run_logger=run_logger,
-                    )
-                    output_files.extend(email_outputs)
-                    email_summary['threads_total'] += email_batch_stats.get('threads_total', 0)
-                    email_summary['batches_total'] += email_batch_stats.get('batches_total', 0)
-                    email_summary['output_total_bytes'] += email_batch_stats.get('output_total_bytes', 0)
-                    email_summary['batch_to_threads'].update(email_batch_stats.get('batch_to_threads', {}))
-                    run_logger.log("info", "email_thread_end", "Completed email threading", group=group_name, outputs=len(email_outputs))
+            finally:
+                if pending_pdf_merges:
+                    if cancel_event is not None and cancel_event.is_set():
+                        for _, _, _, future in pending_pdf_merges:
+                            future.cancel()
+                    # Collect in submission order and splice each group's outputs back in
+                    # at the slot it would have filled in-process, so output order does
+                    # not depend on max_workers.
+                    inserted = 0
+                    for pending_group, output_slot, pending_pdfs, future in pending_pdf_merges:
+                        if future.cancelled():
+                            continue
+                        try:
+                            pdf_outputs, pdf_warnings = future.result()
+                        except Exception as exc:
+                            # A crashed worker or a broken pool must not drop the group:
+                            # merge it here instead, without any process pool.
+                            _record_warning(
+                                warnings,
+                                'pdf_merge_worker_failed',
+                                'PDF merge worker failed; merging group PDFs in-process instead',
+                                group=pending_group,
+                                error=str(exc),
+                            )
+                            pdf_warnings = []
+                            pdf_outputs = self.pdf_merger.merge_pdfs(
+                                pending_pdfs,
+                                processed_dir,
+                                pending_group,
+                                warnings=warnings,
+                            )
+                        warnings.extend(pdf_warnings)
+                        slot = output_slot + inserted
+                        output_files[slot:slot] = pdf_outputs
+                        inserted += len(pdf_outputs)
+                        run_logger.log("info", "pdf_merge_end", "Completed PDF merge", group=pending_group, outputs=len(pdf_outputs))
+                        _safe_progress(progress_callback, file_count, total_input_files, f"Merged PDFs for {pending_group}")
                     warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
-
-                file_count += group_file_weights.get(group_name, 0)
-                _safe_progress(progress_callback, file_count, total_input_files, f"Processed {group_name}")
-                run_logger.log("info", "group_end", "Finished group", group=group_name, processed=file_count, total=total_input_files)
-                warning_cursor = self._sync_warning_events(warnings, warning_cursor, run_logger)
+                if pdf_pool is not None:
+                    pdf_pool.shutdown()
 
             failed_files, skipped_files = self._collect_file_outcomes_from_warnings(warnings)
             failed_artifacts_total = self._materialize_failed_artifacts(
@@ -2290,8 +3089,7 @@ class MergeOrchestrator:
                 manifest['emails'] = email_summary
 
             try:
-                with open(manifest_path, 'w', encoding='utf-8') as f:
-                    json.dump(manifest, f, indent=2)
+                _write_json_file(manifest_path, manifest)
                 run_logger.log("info", "manifest_written", "Wrote merge manifest", path=manifest_path)
             except Exception as manifest_exc:
                 run_logger.log(
@@ -2319,6 +3117,47 @@ class MergeOrchestrator:
 
         return manifest
 
+    def _create_pdf_pool(self) -> Optional[_LazyProcessPool]:
+        """Return the run's lazily started PDF process pool, or None to merge in-process."""
+        if not (self.process_pdfs or self.process_docx) or self.max_workers <= 1 or not HAS_PYPDF:
+            return None
+        return _LazyProcessPool(self._spawn_process_pool, self.max_workers)
+
+    @staticmethod
+    def _count_pdf_groups(groups: Dict[str, List[str]]) -> int:
+        return sum(
+            1 for files in groups.values()
+            if any(_file_kind(path) == 'pdf' for path in files)
+        )
+
+    def _merge_pdfs_in_batches(
+        self,
+        pdf_files: List[Union[str, Tuple[str, int]]],
+        output_path: str,
+        group_name: str,
+        batch_count: int,
+        pdf_pool: Optional[_LazyProcessPool] = None,
+        **merge_kwargs: Any,
+    ) -> List[str]:
+        """Merge one group's PDFs in-process, saving independent batches in the run's pool when there are several."""
+        executor = pdf_pool.get() if pdf_pool is not None and batch_count > 1 else None
+        return self.pdf_merger.merge_pdfs(
+            pdf_files,
+            output_path,
+            group_name,
+            executor=executor,
+            **merge_kwargs,
+        )
+
+    @staticmethod
+    def _spawn_process_pool(max_workers: int) -> ProcessPoolExecutor:
+        # "spawn" avoids forking the GUI's worker thread state on POSIX and
+        # matches the only start method available on Windows.
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
     @staticmethod
     def _sanitize_group_component(value: str) -> str:
         normalized = re.sub(r'[^A-Za-z0-9_-]+', '_', value).strip('_')
@@ -2441,8 +3280,7 @@ class MergeOrchestrator:
 
     @staticmethod
     def _is_supported_processable_file(file_path: str) -> bool:
-        supported = ('.pdf', '.docx', '.doc', '.msg', '.eml')
-        return file_path.lower().endswith(supported)
+        return _file_kind(file_path) is not None
 
     @staticmethod
     def _relative_path_under(source_path: str, base_path: str) -> str:
@@ -2753,6 +3591,7 @@ class MergeOrchestrator:
         progress_callback=None,
         progress_interval: int = 10,
         run_logger: Optional[RunLogger] = None,
+        pdf_pool: Optional[_LazyProcessPool] = None,
     ) -> Tuple[List[str], Dict[str, List[str]], Dict[str, int]]:
         """Convert .doc/.docx files to PDF, then merge converted PDFs."""
         word_files = sorted(word_files)
@@ -2818,7 +3657,9 @@ class MergeOrchestrator:
                 )
                 return [], {}, conversion_summary
 
-            required_outputs = self.pdf_merger.estimate_batch_count(converted_pdf_files)
+            # Size each converted PDF once for both the estimate and the merge.
+            converted_pdf_entries = _with_file_sizes(converted_pdf_files)
+            required_outputs = self.pdf_merger.estimate_batch_count(converted_pdf_entries)
             self._ensure_output_capacity(
                 required_outputs,
                 current_output_count,
@@ -2826,10 +3667,12 @@ class MergeOrchestrator:
             )
 
             output_to_sources: Dict[str, List[str]] = {}
-            doc_outputs = self.pdf_merger.merge_pdfs(
-                converted_pdf_files,
+            doc_outputs = self._merge_pdfs_in_batches(
+                converted_pdf_entries,
                 output_path,
                 group_name,
+                required_outputs,
+                pdf_pool=pdf_pool,
                 warnings=warnings,
                 output_label="documents",
                 bookmark_titles=bookmark_titles,
@@ -2868,6 +3711,12 @@ class MergeOrchestrator:
                 f"(max_output_files={self.max_output_files})."
             )
 
+    def _extract_email_file(self, email_file: str) -> Optional[Dict]:
+        """Extract a single .msg/.eml file; the extractors return None when parsing fails."""
+        if email_file.lower().endswith('.msg'):
+            return self.email_extractor.extract_msg(email_file)
+        return self.email_extractor.extract_eml(email_file)
+
     def _prepare_email_threads(
         self,
         email_files: List[str],
@@ -2881,12 +3730,16 @@ class MergeOrchestrator:
             "attachment_refs_total": 0,
         }
         
-        for email_file in email_files:
-            if email_file.lower().endswith('.msg'):
-                data = self.email_extractor.extract_msg(email_file)
-            else:
-                data = self.email_extractor.extract_eml(email_file)
-            
+        # Extraction is dominated by file reads and MIME/OLE decoding, so a
+        # thread pool overlaps the I/O; results keep the input order.
+        workers = min(_email_extract_workers(), len(email_files))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                extracted = list(executor.map(self._extract_email_file, email_files))
+        else:
+            extracted = [self._extract_email_file(email_file) for email_file in email_files]
+
+        for email_file, data in zip(email_files, extracted):
             if data:
                 data['file_path'] = email_file
                 data['attachments'] = data.get('attachments', []) or []
@@ -2913,14 +3766,14 @@ class MergeOrchestrator:
     ) -> str:
         lines = [
             f"EMAIL {index} of {total}",
-            "=" * 80,
+            _SECTION_RULE,
             f"Subject: {email.get('subject', '')}",
             f"From: {email.get('from', '')}",
             f"To: {email.get('to', '')}",
             f"CC: {email.get('cc', '')}",
             f"Date: {email.get('date', '')}",
             f"Source: {os.path.basename(email.get('file_path', ''))}",
-            "-" * 80,
+            _ENTRY_RULE,
             "",
             email.get('body', '') or "",
             "",
@@ -2941,7 +3794,7 @@ class MergeOrchestrator:
                 lines.append("- none")
             lines.append("")
 
-        lines.append("=" * 80)
+        lines.append(_SECTION_RULE)
         lines.append("")
         return "\n".join(lines)
 
@@ -2956,7 +3809,7 @@ class MergeOrchestrator:
             f"EMAIL THREAD {thread_num}",
             f"THREAD KEY: {normalized_key}",
             f"TOTAL EMAILS: {len(emails)}",
-            "=" * 80,
+            _SECTION_RULE,
             "",
         ]
         for idx, email in enumerate(emails, 1):
@@ -2991,7 +3844,7 @@ class MergeOrchestrator:
                 except OSError:
                     pass
             batch_map = {}
-            for index, (thread_key, emails) in enumerate(sorted(threads.items()), 1):
+            for index, (thread_key, emails) in enumerate(sorted(threads.items(), key=lambda item: item[0]), 1):
                 key = os.path.join(output_path, f"{group_name}_emails_thread{index}.txt")
                 batch_map[key] = [{"thread_key": thread_key, "email_count": len(emails)}]
             return outputs, {
@@ -3020,12 +3873,11 @@ class MergeOrchestrator:
 
         # Write thread files
         output_files = []
-        for thread_num, (thread_key, emails) in enumerate(sorted(threads.items()), 1):
+        for thread_num, (thread_key, emails) in enumerate(sorted(threads.items(), key=lambda item: item[0]), 1):
             output_file = os.path.join(output_path, f"{group_name}_emails_thread{thread_num}.txt")
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"GROUP: {group_name}\n")
-                f.write(self._render_thread_block(thread_num, thread_key, emails))
+            with open(output_file, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+                f.write(f"GROUP: {group_name}\n" + self._render_thread_block(thread_num, thread_key, emails))
             
             output_files.append(output_file)
             print(f"    Created: {os.path.basename(output_file)} ({len(emails)} emails)")
@@ -3045,7 +3897,7 @@ class MergeOrchestrator:
         max_batch_bytes = self.email_max_output_file_mb * 1024 * 1024
         max_batch_words = 500000  # netdoc word limit
         thread_blocks = []
-        for thread_num, (thread_key, emails) in enumerate(sorted(threads.items()), 1):
+        for thread_num, (thread_key, emails) in enumerate(sorted(threads.items(), key=lambda item: item[0]), 1):
             block_text = self._render_thread_block(thread_num, thread_key, emails)
             block_bytes = len(block_text.encode("utf-8"))
             block_words = len(block_text.split())
@@ -3110,16 +3962,15 @@ class MergeOrchestrator:
         for batch_num, batch_blocks in enumerate(planned_batches, 1):
             output_file = os.path.join(output_path, f"{group_name}_{self.email_batch_name_prefix}{batch_num}.txt")
             batch_word_count = sum(block["words"] for block in batch_blocks)
-            with open(output_file, "w", encoding="utf-8") as handle:
-                handle.write(f"EMAIL BATCH {batch_num}\n")
-                handle.write(f"GROUP: {group_name}\n")
-                handle.write(f"BATCH THREADS: {len(batch_blocks)}\n")
-                handle.write(f"BATCH WORDS: {batch_word_count}\n")
-                handle.write("=" * 80 + "\n\n")
-                for idx, block in enumerate(batch_blocks):
-                    if idx > 0:
-                        handle.write("\n")
-                    handle.write(block["text"])
+            header = (
+                f"EMAIL BATCH {batch_num}\n"
+                f"GROUP: {group_name}\n"
+                f"BATCH THREADS: {len(batch_blocks)}\n"
+                f"BATCH WORDS: {batch_word_count}\n"
+                f"{_SECTION_RULE}\n\n"
+            )
+            with open(output_file, "w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE) as handle:
+                handle.write(header + "\n".join(block["text"] for block in batch_blocks))
 
             try:
                 file_size = os.path.getsize(output_file)
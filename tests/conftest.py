@@ -1,30 +1,123 @@
+from io import BytesIO
 from pathlib import Path
-import shutil
 import os
+import shutil
 import tempfile
-import uuid
 
 import pytest
 from docx import Document
 from pypdf import PdfWriter
 
+from merger_engine import MergeOrchestrator
 
-@pytest.fixture
-def tmp_path():
+
+def _render_blank_pdf() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+# One-page PDF written by the fake Word converter for every "converted" file.
+_BLANK_PDF_BYTES = _render_blank_pdf()
+
+# Subject, optional Date line, body; filled in by build_eml.
+_EML_TEMPLATE = (
+    b"From: sender@example.com\n"
+    b"To: receiver@example.com\n"
+    b"Subject: %b\n"
+    b"%b"
+    b"Content-Type: text/plain; charset=utf-8\n"
+    b"\n"
+    b"%b\n"
+)
+
+
+def build_eml(subject: str, body: str, date: str = "Mon, 1 Jan 2024 10:00:00 +0000") -> bytes:
+    """Plain-text .eml bytes; an empty date leaves out the Date header."""
+    date_line = b"Date: %b\n" % date.encode("utf-8") if date else b""
+    return _EML_TEMPLATE % (subject.encode("utf-8"), date_line, body.encode("utf-8"))
+
+
+def _default_temproot() -> Path:
     """
-    Local override for pytest's tmp_path fixture.
-    Some Windows environments create tmp roots with restrictive ACLs that
-    break test setup/teardown. This keeps temp dirs under LOCALAPPDATA/Temp.
+    Prefer a RAM-backed temp root: PYTEST_RAMDISK if set (e.g. a Windows RAM
+    disk), else /dev/shm on Linux. Otherwise stay under LOCALAPPDATA/Temp,
+    since some Windows environments create tmp roots with restrictive ACLs
+    that break test setup/teardown.
     """
+    ramdisk = os.environ.get("PYTEST_RAMDISK")
+    if ramdisk and Path(ramdisk).is_dir():
+        return Path(ramdisk)
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
     base_root = Path(os.environ.get("LOCALAPPDATA", tempfile.gettempdir()))
-    base = base_root / "Temp" / "codex_pytest_cases"
-    base.mkdir(parents=True, exist_ok=True)
-    path = base / f"case_{uuid.uuid4().hex}"
-    path.mkdir(parents=True, exist_ok=False)
+    return base_root / "Temp"
+
+
+def pytest_configure(config):
+    # Only the root moves: pytest still creates a per-user, numbered basetemp
+    # (pytest-of-<user>/pytest-N) beneath it, so concurrent runs never share or
+    # wipe each other's directories. An explicit --basetemp is left alone.
+    if config.option.basetemp or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    temproot = _default_temproot()
+    temproot.mkdir(parents=True, exist_ok=True)
+    os.environ["PYTEST_DEBUG_TEMPROOT"] = str(temproot)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # A fully green run leaves nothing worth inspecting, so free the RAM-backed
+    # basetemp once at the end. Failed runs keep every test's directory, and
+    # pytest still prunes old numbered basetemps. xdist workers share the
+    # controller's basetemp, and an explicit --basetemp is left alone.
+    if exitstatus != 0 or hasattr(session.config, "workerinput") or session.config.option.basetemp:
+        return
+    factory = getattr(session.config, "_tmp_path_factory", None)
+    basetemp = getattr(factory, "_basetemp", None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+def _place(source: Path, destination: Path) -> Path:
+    """Hard-link a fixture file into place, copying when links are unsupported."""
     try:
-        yield path
-    finally:
-        shutil.rmtree(path, ignore_errors=True)
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+    return destination
+
+
+@pytest.fixture
+def place():
+    return _place
+
+
+@pytest.fixture(scope="session")
+def orchestrator_factory():
+    """
+    Return one MergeOrchestrator per distinct configuration for the session.
+    merge_documents keeps no state on the instance between runs; do not use
+    this where a test patches something the constructor captures (such as
+    WordToPdfConverter via patch_word_converter).
+    """
+    cache = {}
+
+    def _make(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = MergeOrchestrator(**kwargs)
+        return cache[key]
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def email_orchestrator(orchestrator_factory):
+    """Session-wide email-only orchestrator, shared with orchestrator_factory callers."""
+    return orchestrator_factory(process_pdfs=False, process_docx=False, process_emails=True)
 
 
 @pytest.fixture
@@ -35,27 +128,42 @@ def io_dirs(tmp_path: Path):
     return input_dir, output_dir
 
 
+@pytest.fixture(scope="session")
+def _template_cache():
+    """Serialized fixture documents, built once per session and keyed by content."""
+    return {}
+
+
 @pytest.fixture
-def make_pdf(tmp_path: Path):
+def make_pdf(tmp_path: Path, _template_cache):
     def _make(filename: str, pages: int = 1) -> Path:
+        key = ("pdf", pages)
+        if key not in _template_cache:
+            writer = PdfWriter()
+            for _ in range(pages):
+                writer.add_blank_page(width=72, height=72)
+            buffer = BytesIO()
+            writer.write(buffer)
+            _template_cache[key] = buffer.getvalue()
         path = tmp_path / filename
-        writer = PdfWriter()
-        for _ in range(pages):
-            writer.add_blank_page(width=72, height=72)
-        with path.open("wb") as handle:
-            writer.write(handle)
+        path.write_bytes(_template_cache[key])
         return path
 
     return _make
 
 
 @pytest.fixture
-def make_docx(tmp_path: Path):
+def make_docx(tmp_path: Path, _template_cache):
     def _make(filename: str, text: str) -> Path:
+        key = ("docx", text)
+        if key not in _template_cache:
+            document = Document()
+            document.add_paragraph(text)
+            buffer = BytesIO()
+            document.save(buffer)
+            _template_cache[key] = buffer.getvalue()
         path = tmp_path / filename
-        document = Document()
-        document.add_paragraph(text)
-        document.save(path)
+        path.write_bytes(_template_cache[key])
         return path
 
     return _make
@@ -65,59 +173,53 @@ def make_docx(tmp_path: Path):
 def make_eml(tmp_path: Path):
     def _make(filename: str, subject: str, body: str, date_header: str = "") -> Path:
         path = tmp_path / filename
-        date_line = f"Date: {date_header}\n" if date_header else ""
-        content = (
-            "From: sender@example.com\n"
-            "To: receiver@example.com\n"
-            f"Subject: {subject}\n"
-            f"{date_line}"
-            "Content-Type: text/plain; charset=utf-8\n"
-            "\n"
-            f"{body}\n"
-        )
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(build_eml(subject, body, date_header))
         return path
 
     return _make
 
 
+class FakeWordConverter:
+    """Stand-in for WordToPdfConverter that writes a blank PDF per document."""
+
+    # Sources whose path contains this substring fail to convert; set per test.
+    fail_contains = ""
+
+    def __init__(self, warnings=None, timeout_seconds=120):
+        self.warnings = warnings
+        self.timeout_seconds = timeout_seconds
+
+    @staticmethod
+    def is_available():
+        return True, ""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def convert_file(self, source_path: str, output_pdf_path: str) -> bool:
+        if self.fail_contains and self.fail_contains in source_path:
+            if self.warnings is not None:
+                self.warnings.append(
+                    {
+                        "code": "word_to_pdf_failed",
+                        "message": "Word-to-PDF conversion failed; skipping file",
+                        "file": source_path,
+                        "error": "mock_failure",
+                    }
+                )
+            return False
+
+        Path(output_pdf_path).write_bytes(_BLANK_PDF_BYTES)
+        return True
+
+
 @pytest.fixture
 def patch_word_converter(monkeypatch):
     def _patch(fail_contains: str = ""):
-        class FakeWordConverter:
-            def __init__(self, warnings=None, timeout_seconds=120):
-                self.warnings = warnings
-                self.timeout_seconds = timeout_seconds
-
-            @staticmethod
-            def is_available():
-                return True, ""
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, exc_type, exc, tb):
-                return False
-
-            def convert_file(self, source_path: str, output_pdf_path: str) -> bool:
-                if fail_contains and fail_contains in source_path:
-                    if self.warnings is not None:
-                        self.warnings.append(
-                            {
-                                "code": "word_to_pdf_failed",
-                                "message": "Word-to-PDF conversion failed; skipping file",
-                                "file": source_path,
-                                "error": "mock_failure",
-                            }
-                        )
-                    return False
-
-                writer = PdfWriter()
-                writer.add_blank_page(width=72, height=72)
-                with open(output_pdf_path, "wb") as handle:
-                    writer.write(handle)
-                return True
-
+        monkeypatch.setattr(FakeWordConverter, "fail_contains", fail_contains)
         monkeypatch.setattr("merger_engine.WordToPdfConverter", FakeWordConverter)
 
     return _patch
@@ -1,7 +1,12 @@
+import multiprocessing
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
 from docx import Document
 
+import merger_engine
 from merger_engine import DOCXMerger
 
 
@@ -82,3 +87,114 @@ def test_docx_batch_size_splitting_behavior(monkeypatch, tmp_path, make_docx):
 
     assert estimated == 3
     assert len(output_files) == 3
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_printable_run_extraction_keeps_runs_longer_than_three(monkeypatch, use_numpy):
+    if use_numpy and not merger_engine.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr("merger_engine.HAS_NUMPY", use_numpy)
+
+    raw = b"\x00\x01Hello world\x00abc\x02\x03Tab\tsep\r\nend\xffok!!"
+
+    assert merger_engine._extract_printable_runs(raw) == "Hello world\nTab\tsep\r\nend\nok!!"
+
+
+def test_raw_docx_text_fallback_reads_paragraphs_in_order(make_docx):
+    document_path = make_docx("raw.docx", "First paragraph")
+    document = Document(str(document_path))
+    document.add_paragraph("Second paragraph")
+    document.save(str(document_path))
+
+    text = DOCXMerger()._try_extract_docx_text(str(document_path))
+
+    assert text == "First paragraph\nSecond paragraph"
+
+
+def test_broken_docx_package_falls_back_to_raw_text_in_batch(tmp_path):
+    broken = tmp_path / "broken.docx"
+    with zipfile.ZipFile(broken, "w") as archive:
+        # No [Content_Types].xml, so python-docx cannot open the package.
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{merger_engine._W_NS}"><w:body>'
+            "<w:p><w:r><w:t>Recovered text</w:t></w:r></w:p>"
+            "</w:body></w:document>",
+        )
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    warnings = []
+
+    output_file = DOCXMerger()._save_docx_batch([str(broken)], str(output_dir), "case", 1, warnings)
+
+    assert output_file is not None
+    paragraphs = [paragraph.text for paragraph in Document(output_file).paragraphs]
+    assert "Recovered text" in paragraphs
+    assert warnings == []
+
+
+def test_word_count_estimate_counts_body_and_table_paragraphs(make_docx):
+    document_path = make_docx("count.docx", "Intro")
+    document = Document(str(document_path))
+    document.add_paragraph("Second")
+    document.add_table(rows=1, cols=2)
+    document.save(str(document_path))
+
+    # Two body paragraphs plus one paragraph per table cell.
+    assert DOCXMerger()._estimate_docx_word_count(str(document_path)) == 4 * 15
+
+
+def test_docx_bodies_loaded_in_process_pool_match_serial_merge(tmp_path, make_docx):
+    sources = [str(make_docx(f"doc_{index}.docx", f"Paragraph {index}")) for index in range(3)]
+    invalid = tmp_path / "doc_3.docx"
+    invalid.write_text("invalid docx bytes", encoding="utf-8")
+    sources.append(str(invalid))
+    merger = DOCXMerger(max_file_size_kb=1024)
+
+    serial_warnings = []
+    serial = merger.merge_docx(sources, str(tmp_path / "serial"), "group", warnings=serial_warnings)
+    pooled_warnings = []
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+        pooled = merger.merge_docx(
+            sources,
+            str(tmp_path / "pooled"),
+            "group",
+            warnings=pooled_warnings,
+            executor=executor,
+        )
+
+    assert len(pooled) == len(serial) == 1
+    pooled_text = [paragraph.text for paragraph in Document(pooled[0]).paragraphs]
+    assert pooled_text == [paragraph.text for paragraph in Document(serial[0]).paragraphs]
+    assert "Paragraph 2" in pooled_text
+    assert [w["code"] for w in pooled_warnings] == [w["code"] for w in serial_warnings] == ["docx_unreadable"]
+
+
+def test_failed_docx_body_worker_is_loaded_in_process(monkeypatch, tmp_path, make_docx):
+    sources = [str(make_docx(f"doc_{index}.docx", f"Paragraph {index}")) for index in range(3)]
+    invalid = tmp_path / "doc_3.docx"
+    invalid.write_text("invalid docx bytes", encoding="utf-8")
+    sources.append(str(invalid))
+    real_loader = merger_engine._load_docx_body
+
+    def _flaky_loader(docx_file):
+        if docx_file.endswith(("doc_1.docx", "doc_3.docx")):
+            raise RuntimeError("worker died")
+        return real_loader(docx_file)
+
+    # A thread pool stands in for the spawn pool so the patched loader is used.
+    monkeypatch.setattr(merger_engine, "_load_docx_body", _flaky_loader)
+    warnings = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        outputs = DOCXMerger(max_file_size_kb=1024).merge_docx(
+            sources,
+            str(tmp_path / "out"),
+            "group",
+            warnings=warnings,
+            executor=executor,
+        )
+
+    assert len(outputs) == 1
+    paragraphs = [paragraph.text for paragraph in Document(outputs[0]).paragraphs]
+    assert [text for text in paragraphs if text.startswith("Paragraph")] == ["Paragraph 0", "Paragraph 1", "Paragraph 2"]
+    assert [w["code"] for w in warnings] == ["docx_unreadable"]
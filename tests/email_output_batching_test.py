@@ -1,34 +1,39 @@
 from email.message import EmailMessage
 from pathlib import Path
 
-from merger_engine import MergeOrchestrator
-
-
-def _build_eml(subject: str, body: str) -> str:
-    return (
-        "From: sender@example.com\n"
-        "To: receiver@example.com\n"
-        f"Subject: {subject}\n"
-        "Date: Mon, 1 Jan 2024 10:00:00 +0000\n"
-        "Content-Type: text/plain; charset=utf-8\n"
-        "\n"
-        f"{body}\n"
+from conftest import build_eml
+
+
+# ~126 KB body shared by every message in the size-batching test.
+_LARGE_BODY = "line 0\n" * 18000
+
+
+def _build_attachment_eml() -> bytes:
+    msg = EmailMessage()
+    msg["From"] = "sender@example.com"
+    msg["To"] = "receiver@example.com"
+    msg["Subject"] = "Attachment Subject"
+    msg.set_content("Body text")
+    msg.add_attachment(
+        b"binary-content",
+        maintype="application",
+        subtype="octet-stream",
+        filename="attachment.bin",
     )
+    return msg.as_bytes()
 
 
-def test_email_size_batching_respects_limit(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
+# Serialized once at import; the MIME generator output never changes.
+_ATTACH_EML_BYTES = _build_attachment_eml()
+
+
+def test_email_size_batching_respects_limit(io_dirs, orchestrator_factory):
+    input_dir, output_dir = io_dirs
 
     for index in range(24):
-        body = ("line " + str(index) + "\n") * 18000
-        (input_dir / f"m{index}.eml").write_text(
-            _build_eml(f"Thread {index}", body),
-            encoding="utf-8",
-        )
+        (input_dir / f"m{index}.eml").write_bytes(build_eml(f"Thread {index}", _LARGE_BODY))
 
-    orchestrator = MergeOrchestrator(
+    orchestrator = orchestrator_factory(
         process_pdfs=False,
         process_docx=False,
         process_emails=True,
@@ -44,25 +49,12 @@ def test_email_size_batching_respects_limit(tmp_path):
     assert result["emails"]["batches_total"] == len(outputs)
 
 
-def test_email_output_contains_attachment_index(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
+def test_email_output_contains_attachment_index(io_dirs, orchestrator_factory):
+    input_dir, output_dir = io_dirs
 
-    msg = EmailMessage()
-    msg["From"] = "sender@example.com"
-    msg["To"] = "receiver@example.com"
-    msg["Subject"] = "Attachment Subject"
-    msg.set_content("Body text")
-    msg.add_attachment(
-        b"binary-content",
-        maintype="application",
-        subtype="octet-stream",
-        filename="attachment.bin",
-    )
-    (input_dir / "with_attachment.eml").write_bytes(msg.as_bytes())
+    (input_dir / "with_attachment.eml").write_bytes(_ATTACH_EML_BYTES)
 
-    orchestrator = MergeOrchestrator(
+    orchestrator = orchestrator_factory(
         process_pdfs=False,
         process_docx=False,
         process_emails=True,
@@ -74,20 +66,18 @@ def test_email_output_contains_attachment_index(tmp_path):
     assert "attachment.bin" in output_text
 
 
-def test_failed_email_is_copied_to_failed_folder(tmp_path, monkeypatch):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
+def test_failed_email_is_copied_to_failed_folder(io_dirs, monkeypatch, orchestrator_factory):
+    input_dir, output_dir = io_dirs
 
     broken = input_dir / "broken.eml"
-    broken.write_text(_build_eml("Broken", "Will fail"), encoding="utf-8")
+    broken.write_bytes(build_eml("Broken", "Will fail"))
 
     monkeypatch.setattr(
         "merger_engine.EmailExtractor.extract_eml",
         staticmethod(lambda _path: None),
     )
 
-    orchestrator = MergeOrchestrator(
+    orchestrator = orchestrator_factory(
         process_pdfs=False,
         process_docx=False,
         process_emails=True,
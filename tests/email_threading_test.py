@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from merger_engine import EmailThreader
+from merger_engine import EmailExtractor, EmailThreader
 
 
 def test_group_emails_handles_mixed_date_types_without_crashing():
@@ -36,3 +36,44 @@ def test_group_emails_handles_mixed_date_types_without_crashing():
     # Invalid or missing dates are normalized to datetime.min and sorted first.
     assert ordered_files[0:2] == ["b.eml", "d.eml"]
     assert ordered_files[2:] == ["c.eml", "a.eml"]
+
+
+def test_normalize_subject_strips_stacked_prefixes():
+    subjects = ["RE: FW: Re:  Budget   Review", "Fwd : budget review", "Budget Review", ""]
+
+    assert [EmailThreader.normalize_subject(subject) for subject in subjects] == [
+        "budget review",
+        "budget review",
+        "budget review",
+        "",
+    ]
+    assert EmailThreader.normalize_subjects(subjects) == [
+        EmailThreader.normalize_subject(subject) for subject in subjects
+    ]
+
+
+def test_extracted_eml_carries_parsed_sort_date(make_eml):
+    path = make_eml("dated.eml", "Status", "Body", date_header="Tue, 2 Jan 2024 09:30:00 -0500")
+
+    data = EmailExtractor.extract_eml(str(path))
+
+    assert data["date"] == "Tue, 02 Jan 2024 09:30:00 -0500"
+    assert data["date_sort"] == datetime(2024, 1, 2, 14, 30, 0)
+
+
+def test_group_emails_sorts_by_precomputed_date_sort_stably():
+    email_data = [
+        {"subject": "Plan", "date": "ignored", "date_sort": datetime(2024, 1, 3), "file_path": "late.eml"},
+        {"subject": "Plan", "date_sort": datetime.min, "file_path": "undated_1.eml"},
+        {"subject": "RE: Plan", "date": "Mon, 1 Jan 2024 10:00:00 +0000", "file_path": "early.eml"},
+        {"subject": "Plan", "date_sort": datetime.min, "file_path": "undated_2.eml"},
+    ]
+
+    threads = EmailThreader().group_emails(email_data)
+
+    assert [email["file_path"] for email in threads["plan"]] == [
+        "undated_1.eml",
+        "undated_2.eml",
+        "early.eml",
+        "late.eml",
+    ]
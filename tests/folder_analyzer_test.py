@@ -0,0 +1,27 @@
+from merger_engine import FolderAnalyzer
+
+
+def test_analyze_structure_groups_by_first_subfolder_and_records_sizes(tmp_path):
+    (tmp_path / "CaseA" / "nested").mkdir(parents=True)
+    (tmp_path / "CaseB").mkdir()
+    (tmp_path / "excluded").mkdir()
+    (tmp_path / "top.pdf").write_bytes(b"a" * 3)
+    (tmp_path / "CaseA" / "one.pdf").write_bytes(b"b" * 5)
+    (tmp_path / "CaseA" / "nested" / "two.eml").write_bytes(b"c" * 7)
+    (tmp_path / "CaseB" / "three.docx").write_bytes(b"d" * 11)
+    (tmp_path / "excluded" / "skip.pdf").write_bytes(b"e")
+
+    file_sizes = {}
+    groups = FolderAnalyzer.analyze_structure(
+        str(tmp_path),
+        exclude_paths=[str(tmp_path / "excluded")],
+        file_sizes=file_sizes,
+    )
+
+    assert {name: sorted(files) for name, files in groups.items()} == {
+        "root": [str(tmp_path / "top.pdf")],
+        "CaseA": sorted([str(tmp_path / "CaseA" / "one.pdf"), str(tmp_path / "CaseA" / "nested" / "two.eml")]),
+        "CaseB": [str(tmp_path / "CaseB" / "three.docx")],
+    }
+    assert file_sizes[str(tmp_path / "CaseA" / "nested" / "two.eml")] == 7
+    assert str(tmp_path / "excluded" / "skip.pdf") not in file_sizes
@@ -1,7 +1,13 @@
 from pathlib import Path
 
+import pytest
 
-def test_gui_default_max_file_size_is_100mb():
-    source = Path("document_merger_gui.py").read_text(encoding="utf-8")
-    assert "self.max_file_size = tk.IntVar(value=102400)" in source
-    assert "event_callback=self.on_run_event" in source
+
+@pytest.fixture(scope="session")
+def gui_source() -> bytes:
+    return (Path(__file__).resolve().parent.parent / "document_merger_gui.py").read_bytes()
+
+
+def test_gui_default_max_file_size_is_100mb(gui_source):
+    assert b"self.max_file_size = tk.IntVar(value=102400)" in gui_source
+    assert b"event_callback=self.on_run_event" in gui_source
@@ -1,7 +1,12 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import merger_engine
 from merger_engine import MergeOrchestrator
 
 
-def test_email_only_creates_output_directory_and_manifest(tmp_path):
+def test_email_only_creates_output_directory_and_manifest(tmp_path, orchestrator_factory):
     input_dir = tmp_path / "input"
     input_dir.mkdir()
     email_file = input_dir / "thread.eml"
@@ -17,7 +22,7 @@ def test_email_only_creates_output_directory_and_manifest(tmp_path):
 
     output_dir = input_dir / "merged_output"
 
-    orchestrator = MergeOrchestrator(
+    orchestrator = orchestrator_factory(
         process_pdfs=False,
         process_docx=False,
         process_emails=True,
@@ -42,7 +47,7 @@ def test_email_only_creates_output_directory_and_manifest(tmp_path):
     assert "failed_artifacts_total" in result["summary"]
 
 
-def test_output_directory_nested_in_input_is_excluded_from_scan(tmp_path):
+def test_output_directory_nested_in_input_is_excluded_from_scan(tmp_path, orchestrator_factory):
     input_dir = tmp_path / "input"
     output_dir = input_dir / "merged_output"
     input_dir.mkdir()
@@ -59,7 +64,7 @@ def test_output_directory_nested_in_input_is_excluded_from_scan(tmp_path):
         encoding="utf-8",
     )
 
-    orchestrator = MergeOrchestrator(
+    orchestrator = orchestrator_factory(
         process_pdfs=False,
         process_docx=False,
         process_emails=True,
@@ -70,7 +75,7 @@ def test_output_directory_nested_in_input_is_excluded_from_scan(tmp_path):
     assert result["total_input_files"] == 1
 
 
-def test_progress_callback_uses_global_total(tmp_path):
+def test_progress_callback_uses_global_total(tmp_path, orchestrator_factory):
     input_dir = tmp_path / "input"
     group_a = input_dir / "GroupA"
     group_b = input_dir / "GroupB"
@@ -93,7 +98,7 @@ def test_progress_callback_uses_global_total(tmp_path):
     def progress(current, total, message):
         callbacks.append((current, total, message))
 
-    orchestrator = MergeOrchestrator(
+    orchestrator = orchestrator_factory(
         process_pdfs=False,
         process_docx=False,
         process_emails=True,
@@ -108,3 +113,138 @@ def test_progress_callback_uses_global_total(tmp_path):
     assert callbacks
     assert all(total == 2 for _, total, _ in callbacks)
     assert callbacks[-1][0] == 2
+
+
+def test_manifest_file_matches_returned_manifest(io_dirs, orchestrator_factory):
+    input_dir, output_dir = io_dirs
+    (input_dir / "mail.eml").write_text(
+        "From: a@example.com\nTo: b@example.com\nSubject: Caf\u00e9\n"
+        "Content-Type: text/plain; charset=utf-8\n\nBody\n",
+        encoding="utf-8",
+    )
+
+    orchestrator = orchestrator_factory(
+        process_pdfs=False,
+        process_docx=False,
+        process_emails=True,
+    )
+    result = orchestrator.merge_documents(str(input_dir), str(output_dir))
+
+    manifest_path = output_dir / "processed" / "merge_manifest.json"
+    written = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert written["run_id"] == result["run_id"]
+    assert written["output_files"] == result["output_files"]
+    assert written["emails"]["batch_to_threads"] == result["emails"]["batch_to_threads"]
+
+
+def test_manifest_round_trips_without_orjson(io_dirs, orchestrator_factory, monkeypatch):
+    monkeypatch.setattr(merger_engine, "HAS_ORJSON", False)
+    input_dir, output_dir = io_dirs
+    (input_dir / "mail.eml").write_text(
+        "From: a@example.com\nTo: b@example.com\nSubject: Caf\u00e9\n"
+        "Content-Type: text/plain; charset=utf-8\n\nBody\n",
+        encoding="utf-8",
+    )
+
+    orchestrator = orchestrator_factory(
+        process_pdfs=False,
+        process_docx=False,
+        process_emails=True,
+    )
+    result = orchestrator.merge_documents(str(input_dir), str(output_dir))
+
+    manifest_path = output_dir / "processed" / "merge_manifest.json"
+    written = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert written == json.loads(json.dumps(result))
+
+
+def test_pdf_groups_merge_in_worker_processes(tmp_path, make_pdf, make_eml, place):
+    input_dir = tmp_path / "input"
+    for group in ("CaseA", "CaseB"):
+        (input_dir / group).mkdir(parents=True)
+        for name in ("one.pdf", "two.pdf"):
+            source = make_pdf(f"{group}_{name}", pages=1)
+            place(source, input_dir / group / name)
+        place(make_eml(f"{group}.eml", f"{group} mail", "Body"), input_dir / group / "mail.eml")
+
+    output_names = {}
+    for max_workers in (1, 2):
+        orchestrator = MergeOrchestrator(
+            max_file_size_kb=1024,
+            process_pdfs=True,
+            process_docx=False,
+            process_emails=True,
+            max_workers=max_workers,
+        )
+        result = orchestrator.merge_documents(str(input_dir), str(tmp_path / f"output_{max_workers}"))
+        assert all(Path(path).exists() for path in result["output_files"])
+        output_names[max_workers] = [Path(path).name for path in result["output_files"]]
+
+    # Pooled group merges land at their group's position, exactly as in-process.
+    assert output_names[2] == output_names[1] == [
+        "CaseA_pdfs_batch1.pdf",
+        "CaseA_emails_batch1.txt",
+        "CaseB_pdfs_batch1.pdf",
+        "CaseB_emails_batch1.txt",
+    ]
+
+
+def test_failed_pdf_group_worker_falls_back_to_in_process_merge(tmp_path, make_pdf, place, monkeypatch):
+    input_dir = tmp_path / "input"
+    for group in ("CaseA", "CaseB"):
+        (input_dir / group).mkdir(parents=True)
+        place(make_pdf(f"{group}.pdf", pages=1), input_dir / group / "one.pdf")
+
+    def _broken_worker(*_args, **_kwargs):
+        raise RuntimeError("worker could not start")
+
+    # A thread pool stands in for the spawn pool so the patched worker is used.
+    monkeypatch.setattr(MergeOrchestrator, "_spawn_process_pool", staticmethod(ThreadPoolExecutor))
+    monkeypatch.setattr(merger_engine, "_merge_pdf_group_worker", _broken_worker)
+
+    orchestrator = MergeOrchestrator(
+        max_file_size_kb=1024,
+        process_docx=False,
+        process_emails=False,
+        max_workers=2,
+    )
+    result = orchestrator.merge_documents(str(input_dir), str(tmp_path / "output"))
+
+    assert [Path(path).name for path in result["output_files"]] == [
+        "CaseA_pdfs_batch1.pdf",
+        "CaseB_pdfs_batch1.pdf",
+    ]
+    assert all(Path(path).is_file() for path in result["output_files"])
+    fallback_groups = [w["group"] for w in result["warnings"] if w["code"] == "pdf_merge_worker_failed"]
+    assert fallback_groups == ["CaseA", "CaseB"]
+
+
+def test_broken_pdf_pool_is_dropped_for_the_rest_of_the_run():
+    pool = merger_engine._LazyProcessPool(ThreadPoolExecutor, 2)
+    executor = pool.get()
+    assert pool.get() is executor
+
+    # What a ProcessPoolExecutor sets once one of its workers dies.
+    executor._broken = "A child process terminated abruptly"
+
+    assert pool.get() is None
+    assert pool.get() is None
+    pool.shutdown()
+
+
+def test_threaded_email_extraction_keeps_input_order(tmp_path, make_eml, monkeypatch):
+    monkeypatch.setenv("MERGER_EMAIL_THREADS", "4")
+    email_files = [
+        str(make_eml(f"mail_{index:02d}.eml", f"Topic {index:02d}", f"Body {index}"))
+        for index in range(12)
+    ]
+    email_files.append(str(tmp_path / "missing.eml"))
+
+    orchestrator = MergeOrchestrator()
+    warnings = []
+    threads, stats = orchestrator._prepare_email_threads(email_files, warnings)
+
+    assert stats["parsed_total"] == 12
+    assert stats["failed_total"] == 1
+    assert [w["file"] for w in warnings if w["code"] == "email_extract_failed"] == [email_files[-1]]
+    assert [thread[0]["file_path"] for _, thread in sorted(threads.items())] == email_files[:12]
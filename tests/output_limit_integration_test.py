@@ -3,7 +3,7 @@ import pytest
 from merger_engine import MergeOrchestrator
 
 
-def test_orchestrator_enforces_max_output_files_across_types(tmp_path, make_pdf, make_docx, make_eml, patch_word_converter):
+def test_orchestrator_enforces_max_output_files_across_types(tmp_path, make_pdf, make_docx, make_eml, patch_word_converter, place):
     patch_word_converter()
     input_dir = tmp_path / "input"
     input_dir.mkdir()
@@ -12,9 +12,9 @@ def test_orchestrator_enforces_max_output_files_across_types(tmp_path, make_pdf,
     docx_file = make_docx("one.docx", "Body")
     eml_file = make_eml("one.eml", "Subject", "Body")
 
-    (input_dir / pdf_file.name).write_bytes(pdf_file.read_bytes())
-    (input_dir / docx_file.name).write_bytes(docx_file.read_bytes())
-    (input_dir / eml_file.name).write_text(eml_file.read_text(encoding="utf-8"), encoding="utf-8")
+    place(pdf_file, input_dir / pdf_file.name)
+    place(docx_file, input_dir / docx_file.name)
+    place(eml_file, input_dir / eml_file.name)
 
     orchestrator = MergeOrchestrator(
         max_file_size_kb=1024,
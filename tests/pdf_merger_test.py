@@ -1,27 +1,52 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-from PIL import Image
+import pytest
 from pypdf import PdfReader
 
+import merger_engine
 from merger_engine import PDFMerger
 
+# 1x1 white RGB PNG, written under a .pdf name to exercise the image fallback.
+_PNG_1PX = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00"
+    b"\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\xff\xff?\x00\x05\xfe\x02\xfe\r\xefF\xb8"
+    b"\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
 
 def test_merge_valid_pdfs_creates_output(tmp_path, make_pdf):
     pdf1 = make_pdf("a.pdf", pages=1)
     pdf2 = make_pdf("b.pdf", pages=2)
     output_dir = tmp_path / "out"
 
+    page_counts = {}
     merger = PDFMerger(max_file_size_kb=1024)
     output_files = merger.merge_pdfs(
         [str(pdf1), str(pdf2)],
         str(output_dir),
         "case",
         warnings=[],
+        output_page_counts=page_counts,
     )
 
     assert len(output_files) == 1
-    merged_reader = PdfReader(output_files[0])
-    assert len(merged_reader.pages) == 3
+    assert Path(output_files[0]).is_file()
+    assert Path(output_files[0]).read_bytes().startswith(b"%PDF-")
+    assert page_counts == {output_files[0]: 3}
+
+
+def test_single_file_batch_is_copied_verbatim(tmp_path, make_pdf):
+    pdf = make_pdf("only.pdf", pages=2)
+    output_dir = tmp_path / "out"
+
+    merger = PDFMerger(max_file_size_kb=1024)
+    output_files = merger.merge_pdfs([str(pdf)], str(output_dir), "case", warnings=[])
+
+    assert len(output_files) == 1
+    assert Path(output_files[0]).name == "case_pdfs_batch1.pdf"
+    assert Path(output_files[0]).read_bytes() == pdf.read_bytes()
 
 
 def test_corrupt_pdf_is_skipped_with_warning_and_empty_batch_not_written(tmp_path):
@@ -46,8 +71,7 @@ def test_corrupt_pdf_is_skipped_with_warning_and_empty_batch_not_written(tmp_pat
 
 def test_image_fallback_conversion_creates_output(tmp_path):
     disguised_image = tmp_path / "scan.pdf"
-    image = Image.new("RGB", (16, 16), color="white")
-    image.save(disguised_image, format="PNG")
+    disguised_image.write_bytes(_PNG_1PX)
 
     output_dir = tmp_path / "out"
     warnings = []
@@ -81,3 +105,185 @@ def test_pdf_batch_size_splitting_behavior(monkeypatch, tmp_path, make_pdf):
 
     assert estimated == 3
     assert len(output_files) == 3
+
+
+def test_merge_pdfs_uses_presupplied_sizes_without_stat(monkeypatch, tmp_path, make_pdf):
+    pdf_files = [make_pdf(f"{idx}.pdf", pages=1) for idx in range(3)]
+    output_dir = tmp_path / "out"
+
+    def _fail_getsize(*_args, **_kwargs):
+        raise AssertionError("getsize should not be called for sized entries")
+
+    monkeypatch.setattr("merger_engine.os.path.getsize", _fail_getsize)
+
+    merger = PDFMerger(max_file_size_kb=1)  # 1024 bytes
+    sized_entries = [(str(path), 700) for path in pdf_files]
+    estimated = merger.estimate_batch_count(sized_entries)
+    output_files = merger.merge_pdfs(sized_entries, str(output_dir), "case", warnings=[])
+
+    assert estimated == 3
+    assert len(output_files) == 3
+
+
+def test_batches_saved_in_process_pool_match_serial_merge(tmp_path, make_pdf):
+    # Pre-supplied sizes force two files per 1 KB batch without large fixtures.
+    entries = [(str(make_pdf(f"doc_{index}.pdf", pages=index + 1)), 400) for index in range(6)]
+    merger = PDFMerger(max_file_size_kb=1)
+
+    serial_sources = {}
+    serial_pages = {}
+    serial = merger.merge_pdfs(
+        entries,
+        str(tmp_path / "serial"),
+        "case",
+        warnings=[],
+        output_to_sources=serial_sources,
+        output_page_counts=serial_pages,
+    )
+
+    pooled_sources = {}
+    pooled_pages = {}
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+        pooled = merger.merge_pdfs(
+            entries,
+            str(tmp_path / "pooled"),
+            "case",
+            warnings=[],
+            output_to_sources=pooled_sources,
+            output_page_counts=pooled_pages,
+            executor=executor,
+        )
+
+    assert [Path(path).name for path in pooled] == [Path(path).name for path in serial]
+    assert len(pooled) == 3
+    assert [pooled_pages[path] for path in pooled] == [serial_pages[path] for path in serial]
+    assert sum(serial_pages.values()) == sum(range(1, 7))
+    assert sorted(map(sorted, pooled_sources.values())) == sorted(map(sorted, serial_sources.values()))
+
+
+def test_failed_batch_worker_is_saved_in_process(monkeypatch, tmp_path, make_pdf):
+    entries = [(str(make_pdf(f"doc_{index}.pdf", pages=index + 1)), 400) for index in range(6)]
+    real_worker = merger_engine._save_pdf_batch_worker
+
+    def _flaky_worker(merger, batch, output_path, group_name, batch_num, *args):
+        if batch_num == 2:
+            raise RuntimeError("worker died")
+        return real_worker(merger, batch, output_path, group_name, batch_num, *args)
+
+    # A thread pool stands in for the spawn pool so the patched worker is used.
+    monkeypatch.setattr(merger_engine, "_save_pdf_batch_worker", _flaky_worker)
+    merger = PDFMerger(max_file_size_kb=1)
+    warnings = []
+    page_counts = {}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        output_files = merger.merge_pdfs(
+            entries,
+            str(tmp_path / "out"),
+            "case",
+            warnings=warnings,
+            output_page_counts=page_counts,
+            executor=executor,
+        )
+
+    assert [Path(path).name for path in output_files] == [
+        "case_pdfs_batch1.pdf",
+        "case_pdfs_batch2.pdf",
+        "case_pdfs_batch3.pdf",
+    ]
+    assert [page_counts[path] for path in output_files] == [3, 7, 11]
+    assert [(w["code"], w["batch"]) for w in warnings] == [("pdf_batch_worker_failed", 2)]
+
+
+def test_pikepdf_backend_merges_with_bookmarks_and_fallbacks(tmp_path, make_pdf):
+    pytest.importorskip("pikepdf")
+    pdf1 = make_pdf("a.pdf", pages=1)
+    pdf2 = make_pdf("b.pdf", pages=2)
+    disguised_image = tmp_path / "c_scan.pdf"
+    disguised_image.write_bytes(_PNG_1PX)
+    corrupt_pdf = tmp_path / "d_broken.pdf"
+    corrupt_pdf.write_text("not a pdf", encoding="utf-8")
+    warnings = []
+    output_to_sources = {}
+
+    merger = PDFMerger(max_file_size_kb=1024, backend="pikepdf")
+    output_files = merger.merge_pdfs(
+        [str(pdf1), str(pdf2), str(disguised_image), str(corrupt_pdf)],
+        str(tmp_path / "out"),
+        "case",
+        warnings=warnings,
+        bookmark_titles={str(pdf2): "Second"},
+        output_to_sources=output_to_sources,
+    )
+
+    assert len(output_files) == 1
+    reader = PdfReader(output_files[0])
+    assert len(reader.pages) == 4
+    assert [(item.title, reader.get_destination_page_number(item)) for item in reader.outline] == [("Second", 1)]
+    assert output_to_sources[output_files[0]] == [str(pdf1), str(pdf2), str(disguised_image)]
+    assert {warning["code"] for warning in warnings} == {"pdf_unreadable"}
+
+
+def test_unknown_pdf_backend_is_rejected():
+    with pytest.raises(ValueError):
+        PDFMerger(backend="pdfrw")
+
+
+def test_damaged_pdf_skips_image_and_ole_converters(monkeypatch, tmp_path):
+    damaged = tmp_path / "damaged.pdf"
+    damaged.write_bytes(b"%PDF-1.7\n" + b"\x00" * 64)
+    attempted = []
+    monkeypatch.setattr(PDFMerger, "_try_convert_image_to_pdf", lambda self, path: attempted.append("image"))
+    monkeypatch.setattr(PDFMerger, "_try_convert_ole_doc_to_pdf", lambda self, path: attempted.append("ole"))
+    warnings = []
+
+    output_files = PDFMerger(max_file_size_kb=1024).merge_pdfs(
+        [str(damaged)],
+        str(tmp_path / "out"),
+        "case",
+        warnings=warnings,
+    )
+
+    assert output_files == []
+    assert attempted == []
+    assert {warning["code"] for warning in warnings} == {"pdf_unreadable", "pdf_empty_batch"}
+
+
+def test_prefetch_iter_keeps_order_and_falls_back_on_unreadable_paths(tmp_path):
+    paths = []
+    for index in range(5):
+        path = tmp_path / f"file_{index}.bin"
+        path.write_bytes(bytes([index]) * 16)
+        paths.append(str(path))
+    paths.insert(2, str(tmp_path / "missing.bin"))
+
+    results = list(merger_engine._prefetch_iter(paths))
+
+    assert [path for path, _ in results] == paths
+    assert results[2][1] is None
+    assert [buffer.getvalue()[:1] for _, buffer in results if buffer is not None] == [bytes([i]) for i in range(5)]
+
+    # Abandoning the iterator early must not leave the reader thread blocked.
+    iterator = merger_engine._prefetch_iter(paths, depth=1)
+    next(iterator)
+    iterator.close()
+
+
+def test_prefetched_buffers_are_closed_after_their_pages_are_appended(monkeypatch, tmp_path, make_pdf):
+    pdfs = [str(make_pdf(f"{name}.pdf", pages=1)) for name in ("a", "b", "c")]
+    real_prefetch_iter = merger_engine._prefetch_iter
+    buffers = []
+
+    def tracking_prefetch_iter(paths, depth=2):
+        for path, buffer in real_prefetch_iter(paths, depth):
+            buffers.append(buffer)
+            yield path, buffer
+
+    monkeypatch.setattr(merger_engine, "_prefetch_iter", tracking_prefetch_iter)
+
+    merger = PDFMerger(max_file_size_kb=1024)
+    output_files = merger.merge_pdfs(pdfs, str(tmp_path / "out"), "case", warnings=[])
+
+    assert len(output_files) == 1
+    assert len(PdfReader(output_files[0]).pages) == 3
+    assert len(buffers) == 3
+    assert all(buffer is not None and buffer.closed for buffer in buffers)
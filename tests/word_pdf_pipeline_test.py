@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pypdf import PdfReader
@@ -6,26 +8,23 @@ from merger_engine import MergeOrchestrator
 
 
 def _flatten_outline_titles(outline):
-    titles = []
-
-    def walk(items):
-        for item in items:
-            if isinstance(item, list):
-                walk(item)
-                continue
-            title = getattr(item, "title", None)
-            if title:
-                titles.append(str(title))
-
-    if isinstance(outline, list):
-        walk(outline)
-    return titles
+    # Explicit stack instead of recursion; reversed so titles come out in document order.
+    stack = list(reversed(outline)) if isinstance(outline, list) else []
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+            continue
+        title = getattr(item, "title", None)
+        if title:
+            yield str(title)
 
 
 def test_word_documents_convert_and_merge_to_pdf_with_mapping(
     tmp_path,
     make_docx,
     patch_word_converter,
+    place,
 ):
     patch_word_converter()
     input_dir = tmp_path / "input"
@@ -35,8 +34,8 @@ def test_word_documents_convert_and_merge_to_pdf_with_mapping(
     doc_file = tmp_path / "b.doc"
     doc_file.write_text("legacy doc placeholder", encoding="utf-8")
 
-    (input_dir / docx_file.name).write_bytes(docx_file.read_bytes())
-    (input_dir / doc_file.name).write_bytes(doc_file.read_bytes())
+    place(docx_file, input_dir / docx_file.name)
+    place(doc_file, input_dir / doc_file.name)
 
     orchestrator = MergeOrchestrator(
         max_file_size_kb=1024,
@@ -63,6 +62,7 @@ def test_word_conversion_failures_are_skipped_with_warning(
     tmp_path,
     make_docx,
     patch_word_converter,
+    place,
 ):
     patch_word_converter(fail_contains="bad")
     input_dir = tmp_path / "input"
@@ -70,8 +70,8 @@ def test_word_conversion_failures_are_skipped_with_warning(
 
     good = make_docx("good.docx", "ok")
     bad = make_docx("bad.docx", "broken")
-    (input_dir / good.name).write_bytes(good.read_bytes())
-    (input_dir / bad.name).write_bytes(bad.read_bytes())
+    place(good, input_dir / good.name)
+    place(bad, input_dir / bad.name)
 
     orchestrator = MergeOrchestrator(
         max_file_size_kb=1024,
@@ -87,15 +87,15 @@ def test_word_conversion_failures_are_skipped_with_warning(
     assert "word_to_pdf_failed" in warning_codes
 
 
-def test_word_output_includes_source_bookmarks(tmp_path, make_docx, patch_word_converter):
+def test_word_output_includes_source_bookmarks(tmp_path, make_docx, patch_word_converter, place):
     patch_word_converter()
     input_dir = tmp_path / "input"
     input_dir.mkdir()
 
     first = make_docx("first.docx", "first")
     second = make_docx("second.docx", "second")
-    (input_dir / first.name).write_bytes(first.read_bytes())
-    (input_dir / second.name).write_bytes(second.read_bytes())
+    place(first, input_dir / first.name)
+    place(second, input_dir / second.name)
 
     orchestrator = MergeOrchestrator(
         max_file_size_kb=1024,
@@ -107,7 +107,7 @@ def test_word_output_includes_source_bookmarks(tmp_path, make_docx, patch_word_c
     output_pdf = result["output_files"][0]
 
     reader = PdfReader(output_pdf)
-    titles = _flatten_outline_titles(reader.outline)
+    titles = list(_flatten_outline_titles(reader.outline))
 
     assert "first.docx" in titles
     assert "second.docx" in titles
@@ -118,6 +118,7 @@ def test_word_batch_size_splitting_honors_user_value(
     tmp_path,
     make_docx,
     patch_word_converter,
+    place,
 ):
     patch_word_converter()
     input_dir = tmp_path / "input"
@@ -125,9 +126,15 @@ def test_word_batch_size_splitting_honors_user_value(
 
     files = [make_docx(f"{idx}.docx", f"doc {idx}") for idx in range(3)]
     for file_path in files:
-        (input_dir / file_path.name).write_bytes(file_path.read_bytes())
+        place(file_path, input_dir / file_path.name)
+
+    sized_paths = []
 
-    monkeypatch.setattr("merger_engine.os.path.getsize", lambda *_args, **_kwargs: 700)
+    def _fake_getsize(path):
+        sized_paths.append(path)
+        return 700
+
+    monkeypatch.setattr("merger_engine.os.path.getsize", _fake_getsize)
 
     orchestrator = MergeOrchestrator(
         max_file_size_kb=1,  # 1024 bytes
@@ -139,12 +146,62 @@ def test_word_batch_size_splitting_honors_user_value(
 
     assert result["total_output_files"] == 3
     assert all(Path(path).name.startswith("root_documents_batch") for path in result["output_files"])
+    # Each converted PDF is sized once and shared by the estimate and the merge.
+    converted_sizes = [path for path in sized_paths if path.endswith(".pdf")]
+    assert len(converted_sizes) == len(set(converted_sizes)) == 3
+
+
+def test_pdf_and_word_batches_share_one_process_pool_per_run(
+    monkeypatch,
+    tmp_path,
+    make_pdf,
+    make_docx,
+    patch_word_converter,
+    place,
+):
+    patch_word_converter()
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("a.pdf", "b.pdf"):
+        place(make_pdf(name, pages=3), input_dir / name)
+    for name in ("c.docx", "d.docx"):
+        place(make_docx(name, name), input_dir / name)
+
+    # Converted PDFs are tiny; report them large enough to need one batch each.
+    real_getsize = os.path.getsize
+    monkeypatch.setattr(
+        "merger_engine.os.path.getsize",
+        lambda path: 700 if path.endswith(".pdf") else real_getsize(path),
+    )
+    spawned = []
+
+    def _spawn(max_workers):
+        spawned.append(max_workers)
+        return ThreadPoolExecutor(max_workers)
+
+    monkeypatch.setattr(MergeOrchestrator, "_spawn_process_pool", staticmethod(_spawn))
+
+    orchestrator = MergeOrchestrator(
+        max_file_size_kb=1,  # 1024 bytes: every PDF lands in its own batch
+        process_emails=False,
+        max_workers=2,
+    )
+    result = orchestrator.merge_documents(str(input_dir), str(tmp_path / "out"))
+
+    assert [Path(path).name for path in result["output_files"]] == [
+        "root_pdfs_batch1.pdf",
+        "root_pdfs_batch2.pdf",
+        "root_documents_batch1.pdf",
+        "root_documents_batch2.pdf",
+    ]
+    assert spawned == [2]
 
 
 def test_word_progress_logging_emits_interval_updates(
     tmp_path,
     make_docx,
     patch_word_converter,
+    place,
     capsys,
 ):
     patch_word_converter()
@@ -153,7 +210,7 @@ def test_word_progress_logging_emits_interval_updates(
 
     files = [make_docx(f"{idx}.docx", f"Doc {idx}") for idx in range(5)]
     for file_path in files:
-        (input_dir / file_path.name).write_bytes(file_path.read_bytes())
+        place(file_path, input_dir / file_path.name)
 
     orchestrator = MergeOrchestrator(
         max_file_size_kb=1024,
@@ -1,83 +1,80 @@
 import io
+import re
 import zipfile
 from pathlib import Path
 
-from merger_engine import MergeOrchestrator
+import pytest
 
+from conftest import build_eml
 
-def _build_eml(subject: str, body: str, date: str = "Mon, 1 Jan 2024 10:00:00 +0000") -> str:
-    return (
-        "From: sender@example.com\n"
-        "To: receiver@example.com\n"
-        f"Subject: {subject}\n"
-        f"Date: {date}\n"
-        "Content-Type: text/plain; charset=utf-8\n"
-        "\n"
-        f"{body}\n"
-    )
 
+_SOURCE_LINE_RE = re.compile(r"^Source: (.+)$", re.MULTILINE)
 
-def _write_zip(zip_path: Path, entries):
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+
+def _zip_bytes(entries) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
         for name, payload in entries:
             archive.writestr(name, payload)
+    return buffer.getvalue()
 
 
-def _run_email_only(input_dir: Path, output_dir: Path, **kwargs):
-    orchestrator = MergeOrchestrator(
-        process_pdfs=False,
-        process_docx=False,
-        process_emails=True,
-        **kwargs,
-    )
-    return orchestrator.merge_documents(str(input_dir), str(output_dir))
+# Every fixture archive is built once at import; tests only write the bytes out.
+_LONG_NAME_ARCHIVE = _zip_bytes([(("x" * 120) + ".eml", build_eml("Subject", "Body from long filename"))])
+_COLLISION_ARCHIVE = _zip_bytes(
+    [
+        (("a" * 80) + "_first.eml", build_eml("Collision", "first body")),
+        (("a" * 80) + "_second.eml", build_eml("Collision", "second body")),
+    ]
+)
+_NESTED_ARCHIVE = _zip_bytes(
+    [("inner.zip", _zip_bytes([("inside.eml", build_eml("Nested", "From nested zip"))]))]
+)
+# outer.zip -> middle.zip -> deep.zip -> deep.eml: one level past the nesting limit.
+_DEEP_INNER_ARCHIVE = _zip_bytes([("deep.eml", build_eml("Deep", "Should not be extracted"))])
+_TOO_DEEP_ARCHIVE = _zip_bytes([("middle.zip", _zip_bytes([("deep.zip", _DEEP_INNER_ARCHIVE)]))])
+_SLIP_ARCHIVE = _zip_bytes(
+    [
+        ("../evil.eml", build_eml("Evil", "Should be skipped")),
+        ("good.eml", build_eml("Good", "Expected body")),
+    ]
+)
+_BUNDLE_ARCHIVE = _zip_bytes([("zipped.eml", build_eml("Zipped", "Zipped body"))])
+_SINGLE_ARCHIVE = _zip_bytes([("single.eml", build_eml("Only", "single zip input body"))])
+_MIXED_CONTENT_ARCHIVE = _zip_bytes(
+    [
+        ("mail.eml", build_eml("Mail", "mail body")),
+        ("table.xlsx", b"fake excel bytes"),
+        ("sub/facts.csv", "a,b\n1,2\n"),
+    ]
+)
 
 
-def test_zip_with_long_email_names_extracts_and_threads(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
+def test_zip_with_long_email_names_extracts_and_threads(io_dirs, email_orchestrator):
+    input_dir, output_dir = io_dirs
 
-    long_name = ("x" * 120) + ".eml"
-    zip_path = input_dir / "emails.zip"
-    _write_zip(zip_path, [(long_name, _build_eml("Subject", "Body from long filename"))])
+    (input_dir / "emails.zip").write_bytes(_LONG_NAME_ARCHIVE)
 
-    result = _run_email_only(input_dir, output_dir)
+    result = email_orchestrator.merge_documents(str(input_dir), str(output_dir))
 
     assert result["total_output_files"] == 1
     thread_file = Path(result["output_files"][0])
+    text = thread_file.read_text(encoding="utf-8")
     assert thread_file.name.startswith("root_emails_emails_batch")
-    assert "Body from long filename" in thread_file.read_text(encoding="utf-8")
+    assert "Body from long filename" in text
     assert result["zip_processing"]["entries_renamed"] > 0
 
 
-def test_zip_truncation_collision_resolves_uniquely(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
-
-    repeated = "a" * 80
-    first_name = f"{repeated}_first.eml"
-    second_name = f"{repeated}_second.eml"
+def test_zip_truncation_collision_resolves_uniquely(io_dirs, email_orchestrator):
+    input_dir, output_dir = io_dirs
 
-    zip_path = input_dir / "collision.zip"
-    _write_zip(
-        zip_path,
-        [
-            (first_name, _build_eml("Collision", "first body")),
-            (second_name, _build_eml("Collision", "second body")),
-        ],
-    )
+    (input_dir / "collision.zip").write_bytes(_COLLISION_ARCHIVE)
 
-    result = _run_email_only(input_dir, output_dir)
+    result = email_orchestrator.merge_documents(str(input_dir), str(output_dir))
 
     assert result["total_output_files"] == 1
     text = Path(result["output_files"][0]).read_text(encoding="utf-8")
-    source_lines = [
-        line.replace("Source: ", "", 1)
-        for line in text.splitlines()
-        if line.startswith("Source: ")
-    ]
+    source_lines = _SOURCE_LINE_RE.findall(text)
     assert len(source_lines) == 2
     assert len(set(source_lines)) == 2
     assert all(len(name) <= 50 for name in source_lines)
@@ -85,19 +82,12 @@ def test_zip_truncation_collision_resolves_uniquely(tmp_path):
     assert "second body" in text
 
 
-def test_nested_zip_one_level_supported(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
-
-    inner_buffer = io.BytesIO()
-    with zipfile.ZipFile(inner_buffer, "w", compression=zipfile.ZIP_DEFLATED) as inner_zip:
-        inner_zip.writestr("inside.eml", _build_eml("Nested", "From nested zip"))
+def test_nested_zip_one_level_supported(io_dirs, email_orchestrator):
+    input_dir, output_dir = io_dirs
 
-    outer_zip = input_dir / "outer.zip"
-    _write_zip(outer_zip, [("inner.zip", inner_buffer.getvalue())])
+    (input_dir / "outer.zip").write_bytes(_NESTED_ARCHIVE)
 
-    result = _run_email_only(input_dir, output_dir)
+    result = email_orchestrator.merge_documents(str(input_dir), str(output_dir))
 
     assert result["total_output_files"] == 1
     text = Path(result["output_files"][0]).read_text(encoding="utf-8")
@@ -105,108 +95,70 @@ def test_nested_zip_one_level_supported(tmp_path):
     assert result["zip_processing"]["nested_archives_extracted"] >= 1
 
 
-def test_nested_zip_deeper_than_limit_is_skipped_with_warning(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
-
-    deep_buffer = io.BytesIO()
-    with zipfile.ZipFile(deep_buffer, "w", compression=zipfile.ZIP_DEFLATED) as deep_zip:
-        deep_zip.writestr("deep.eml", _build_eml("Deep", "Should not be extracted"))
-
-    middle_buffer = io.BytesIO()
-    with zipfile.ZipFile(middle_buffer, "w", compression=zipfile.ZIP_DEFLATED) as middle_zip:
-        middle_zip.writestr("deep.zip", deep_buffer.getvalue())
+def test_nested_zip_deeper_than_limit_is_skipped_with_warning(io_dirs, email_orchestrator):
+    input_dir, output_dir = io_dirs
 
-    outer_zip = input_dir / "outer.zip"
-    _write_zip(outer_zip, [("middle.zip", middle_buffer.getvalue())])
+    (input_dir / "outer.zip").write_bytes(_TOO_DEEP_ARCHIVE)
 
-    result = _run_email_only(input_dir, output_dir)
+    result = email_orchestrator.merge_documents(str(input_dir), str(output_dir))
 
     assert result["total_output_files"] == 0
-    warning_codes = {warning["code"] for warning in result.get("warnings", [])}
-    assert "zip_nested_depth_exceeded" in warning_codes
+    assert any(warning["code"] == "zip_nested_depth_exceeded" for warning in result.get("warnings", []))
     assert result["zip_processing"]["nested_archives_skipped_depth"] >= 1
 
 
-def test_zip_slip_entry_is_blocked(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
+def test_zip_slip_entry_is_blocked(tmp_path, io_dirs, email_orchestrator):
+    input_dir, output_dir = io_dirs
 
-    archive_path = input_dir / "slip.zip"
-    _write_zip(
-        archive_path,
-        [
-            ("../evil.eml", _build_eml("Evil", "Should be skipped")),
-            ("good.eml", _build_eml("Good", "Expected body")),
-        ],
-    )
+    (input_dir / "slip.zip").write_bytes(_SLIP_ARCHIVE)
 
-    result = _run_email_only(input_dir, output_dir)
+    result = email_orchestrator.merge_documents(str(input_dir), str(output_dir))
 
-    warning_codes = {warning["code"] for warning in result.get("warnings", [])}
-    assert "zip_entry_skipped_unsafe_path" in warning_codes
+    assert any(warning["code"] == "zip_entry_skipped_unsafe_path" for warning in result.get("warnings", []))
     assert result["zip_processing"]["entries_skipped_unsafe_path"] >= 1
-    skipped_codes = {item["code"] for item in result["files"]["skipped"]}
-    assert "zip_entry_skipped_unsafe_path" in skipped_codes
+    assert any(item["code"] == "zip_entry_skipped_unsafe_path" for item in result["files"]["skipped"])
     assert not (tmp_path / "evil.eml").exists()
     assert result["total_output_files"] == 1
-    assert "Expected body" in Path(result["output_files"][0]).read_text(encoding="utf-8")
+    text = Path(result["output_files"][0]).read_text(encoding="utf-8")
+    assert "Expected body" in text
+    assert "Should be skipped" not in text
 
 
-def test_mixed_zip_and_plain_files_processed_together(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
+def test_mixed_zip_and_plain_files_processed_together(io_dirs, email_orchestrator):
+    input_dir, output_dir = io_dirs
 
     plain_email = input_dir / "plain.eml"
-    plain_email.write_text(_build_eml("Plain", "Plain body"), encoding="utf-8")
+    plain_email.write_bytes(build_eml("Plain", "Plain body"))
 
-    archive_path = input_dir / "bundle.zip"
-    _write_zip(archive_path, [("zipped.eml", _build_eml("Zipped", "Zipped body"))])
+    (input_dir / "bundle.zip").write_bytes(_BUNDLE_ARCHIVE)
 
-    result = _run_email_only(input_dir, output_dir)
+    result = email_orchestrator.merge_documents(str(input_dir), str(output_dir))
 
     output_names = [Path(path).name for path in result["output_files"]]
     assert any(name.startswith("root_emails_batch") for name in output_names)
     assert any(name.startswith("root_bundle_emails_batch") for name in output_names)
 
 
-def test_single_zip_file_path_input_supported(tmp_path):
+def test_single_zip_file_path_input_supported(tmp_path, email_orchestrator):
     zip_path = tmp_path / "single.zip"
-    _write_zip(zip_path, [("single.eml", _build_eml("Only", "single zip input body"))])
+    zip_path.write_bytes(_SINGLE_ARCHIVE)
     output_dir = tmp_path / "output"
 
-    orchestrator = MergeOrchestrator(
-        process_pdfs=False,
-        process_docx=False,
-        process_emails=True,
-    )
-    result = orchestrator.merge_documents(str(zip_path), str(output_dir))
+    result = email_orchestrator.merge_documents(str(zip_path), str(output_dir))
 
     assert result["total_input_files"] == 1
     assert result["total_output_files"] == 1
     assert result["zip_processing"]["archives_found"] == 1
-    assert "single zip input body" in Path(result["output_files"][0]).read_text(encoding="utf-8")
+    text = Path(result["output_files"][0]).read_text(encoding="utf-8")
+    assert "single zip input body" in text
 
 
-def test_zip_unsupported_files_are_moved_to_unprocessed_folder(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
+def test_zip_unsupported_files_are_moved_to_unprocessed_folder(io_dirs, email_orchestrator):
+    input_dir, output_dir = io_dirs
 
-    zip_path = input_dir / "mixed.zip"
-    _write_zip(
-        zip_path,
-        [
-            ("mail.eml", _build_eml("Mail", "mail body")),
-            ("table.xlsx", b"fake excel bytes"),
-            ("sub/facts.csv", "a,b\n1,2\n"),
-        ],
-    )
+    (input_dir / "mixed.zip").write_bytes(_MIXED_CONTENT_ARCHIVE)
 
-    result = _run_email_only(input_dir, output_dir)
+    result = email_orchestrator.merge_documents(str(input_dir), str(output_dir))
 
     assert result["summary"]["moved_unprocessed_total"] == 2
     moved = result["files"]["moved_unprocessed"]
@@ -224,15 +176,18 @@ def test_zip_unsupported_files_are_moved_to_unprocessed_folder(tmp_path):
     assert Path(result["logs"]["jsonl_log"]).exists()
 
 
-def test_input_unsupported_files_are_copied_to_unprocessed_folder(tmp_path):
-    input_dir = tmp_path / "input"
-    output_dir = tmp_path / "output"
-    input_dir.mkdir()
-    (input_dir / "mail.eml").write_text(_build_eml("Subject", "Body"), encoding="utf-8")
-    (input_dir / "meta.xml").write_text("<root/>", encoding="utf-8")
-    (input_dir / "image.png").write_bytes(b"png")
+@pytest.fixture(scope="session")
+def mixed_input_template(tmp_path_factory):
+    """One email plus two unsupported files, built once; merge_documents only reads its input."""
+    template = tmp_path_factory.mktemp("mixed_input")
+    (template / "mail.eml").write_bytes(build_eml("Subject", "Body"))
+    (template / "meta.xml").write_bytes(b"<root/>")
+    (template / "image.png").write_bytes(b"png")
+    return template
+
 
-    result = _run_email_only(input_dir, output_dir)
+def test_input_unsupported_files_are_copied_to_unprocessed_folder(tmp_path, mixed_input_template, email_orchestrator):
+    result = email_orchestrator.merge_documents(str(mixed_input_template), str(tmp_path / "output"))
 
     assert result["summary"]["unprocessed_relocated_total"] == 2
     unprocessed = result["files"]["unprocessed"]